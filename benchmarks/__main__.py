@@ -0,0 +1,96 @@
+"""Run the hydration benchmark suite.
+
+Records the best wall time, and peak traced memory (tracemalloc) of each
+scenario. Results can be saved as a baseline, and compared against a saved
+baseline, failing if any scenario regressed beyond the threshold.
+
+$ python -m benchmarks --save .benchmarks/baseline.json
+$ python -m benchmarks --compare .benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.scenarios import SCENARIOS, Scenario
+
+
+def measure(scenario: Scenario, repeat: int) -> dict[str, float]:
+    run = scenario.setup()
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    # Tracing slows execution, so memory is measured in a separate run.
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    print(
+        f"{'scenario':<20} {'seconds':>10} {'baseline':>10} {'change':>8} {'peak KiB':>10} {'baseline':>10} {'change':>8}",
+    )
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<20} {result['seconds']:>10.4f} {'-':>10} {'-':>8}")
+            continue
+
+        changes = {metric: result[metric] / base[metric] - 1 if base[metric] else 0.0 for metric in result}
+        print(
+            f"{name:<20} {result['seconds']:>10.4f} {base['seconds']:>10.4f} {changes['seconds']:>+8.1%}"
+            f" {result['peak_bytes'] / 1024:>10.0f} {base['peak_bytes'] / 1024:>10.0f} {changes['peak_bytes']:>+8.1%}",
+        )
+        regressions.extend(f"{name} {metric} {change:+.1%}" for metric, change in changes.items() if change > threshold)
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="Only run scenarios containing this string.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario, the best is recorded.")
+    parser.add_argument("--save", type=Path, help="Save results as a baseline.")
+    parser.add_argument("--compare", type=Path, help="Compare results against a saved baseline.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression, as a fraction.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for scenario in SCENARIOS:
+        if args.filter in scenario.name:
+            results[scenario.name] = measure(scenario, args.repeat)
+            if not args.compare:
+                result = results[scenario.name]
+                print(f"{scenario.name:<20} {result['seconds']:>10.4f}s {result['peak_bytes'] / 1024:>10.0f} KiB")
+
+    # Compare before saving, so a baseline can be compared against and replaced in a single run.
+    regressions = compare(results, json.loads(args.compare.read_text()), args.threshold) if args.compare else []
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    if regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Synthetic result set generators, shaped for the models in `tests/model.py`."""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def flat_rows(rows: int, extra_columns: int = 0) -> list[dict]:
+    """Rows for `ModelA`, optionally over fetching unused columns."""
+    extra = {f"extra_{i}": i for i in range(extra_columns)}
+    return [{"id": i, "a": f"a-{i}", **extra} for i in range(rows)]
+
+
+def optional_rows(rows: int, join_ratio: float = 0.5) -> list[dict]:
+    """Rows for `ModelD`, where only `join_ratio` of rows have joined `b` data."""
+    joined = int(rows * join_ratio)
+    return [
+        {
+            "id": i,
+            "d": f"d-{i}",
+            "a__id": i,
+            "a__a": f"a-{i}",
+            "b__id": i if i < joined else None,
+            "b__b": f"b-{i}" if i < joined else None,
+        }
+        for i in range(rows)
+    ]
+
+
+def nested_rows(rows: int, depth: int = 3) -> list[dict]:
+    """Rows for `ModelE` (depth 3), `ModelD` (depth 2) or `ModelA` (depth 1)."""
+    if depth == 1:
+        return flat_rows(rows)
+    if depth == 2:  # noqa: PLR2004
+        return optional_rows(rows, join_ratio=1)
+    return [
+        {
+            "id": i,
+            "e": f"e-{i}",
+            "d__id": i,
+            "d__d": f"d-{i}",
+            "d__a__id": i,
+            "d__a__a": f"a-{i}",
+            "d__b__id": i,
+            "d__b__b": f"b-{i}",
+        }
+        for i in range(rows)
+    ]
+
+
+def list_rows(parents: int, children: int) -> list[dict]:
+    """Rows for `ModelF`, ordered by parent, with `children` list children per parent."""
+    return [
+        {"id": parent, "models__id": child, "models__a": f"a-{child}"}
+        for parent in range(parents)
+        for child in range(children)
+    ]
+
+
+def tree_rows(parents: int, children: int, grandchildren: int) -> list[dict]:
+    """Rows for `ModelH`, ordered by parent, with `children` `ModelF` children each with `grandchildren` children."""
+    return [
+        {
+            "id": parent,
+            "models__id": parent * children + child,
+            "models__models__id": grandchild,
+            "models__models__a": f"a-{grandchild}",
+        }
+        for parent in range(parents)
+        for child in range(children)
+        for grandchild in range(grandchildren)
+    ]
+
+
+def sqlite_db(parents: int, children: int) -> sqlite3.Connection:
+    """In memory database of parents with `children` list children each."""
+    db = sqlite3.connect(":memory:")
+    db.execute("create table parent (id integer primary key)")
+    db.execute("create table child (id integer, parent_id integer, a text)")
+    db.executemany("insert into parent values (?)", [(i,) for i in range(parents)])
+    db.executemany(
+        "insert into child values (?, ?, ?)",
+        [(child, parent, f"a-{child}") for parent in range(parents) for child in range(children)],
+    )
+    return db
+
+
+SQLITE_QUERY = """
+select p.id, c.id as models__id, c.a as models__a
+from parent p
+join child c on c.parent_id = p.id
+order by p.id, c.id
+"""
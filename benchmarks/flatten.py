@@ -0,0 +1,39 @@
+"""Benchmark flattening child list fields as the number of children per parent grows.
+
+Time per child should remain constant (linear scaling) as the fan out grows.
+
+$ python -m benchmarks.flatten
+"""
+
+from __future__ import annotations
+
+import time
+
+from benchmarks.data import list_rows
+from tests.model import ModelF
+
+CHILD_COUNTS = (500, 1000, 2000, 4000, 8000)
+PARENTS = 5
+
+
+def timed(children: int, repeat: int = 5) -> float:
+    data = ModelF._parse_results(list_rows(PARENTS, children))
+    best = float("inf")
+    for _ in range(repeat):
+        # Flattening mutates parent rows, so work on a copy each run.
+        copy = [dict(row) for row in data]
+        start = time.perf_counter()
+        ModelF._prepare(copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'children':>10} {'seconds':>10} {'us/child':>10}")
+    for children in CHILD_COUNTS:
+        elapsed = timed(children)
+        print(f"{children:>10} {elapsed:>10.4f} {elapsed / (children * PARENTS) * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark the memory retained by models against records (`as_records=True`).
+
+$ python -m benchmarks.records
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from benchmarks.data import list_rows, nested_rows
+from tests.model import ModelE, ModelF
+
+ROWS = 20_000
+
+
+def retained(func) -> int:
+    """Measure the traced memory held by the result of `func`."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    print(f"{'scenario':>10} {'models KiB':>12} {'records KiB':>12} {'ratio':>8}")
+    for name, model, rows in (
+        ("nested", ModelE, nested_rows(ROWS)),
+        ("list", ModelF, list_rows(ROWS // 10, 10)),
+    ):
+        # Warm up cached plans, adapters and record classes.
+        model.from_results(rows[:10])
+        model.from_results(rows[:10], as_records=True)
+
+        models = retained(lambda model=model, rows=rows: model.from_results(rows))
+        records = retained(lambda model=model, rows=rows: model.from_results(rows, as_records=True))
+        print(f"{name:>10} {models / 1024:>12.0f} {records / 1024:>12.0f} {models / records:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
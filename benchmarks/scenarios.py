@@ -0,0 +1,81 @@
+"""Benchmark scenarios covering the hydration paths.
+
+Each scenario builds its input once, and returns the callable to measure.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import typing
+
+from benchmarks import data
+from pydantic_db import IdentityMap
+from tests.model import ModelA, ModelD, ModelE, ModelF, ModelH
+
+ROWS = 20_000
+
+
+class Scenario(typing.NamedTuple):
+    name: str
+    setup: typing.Callable[[], typing.Callable[[], object]]
+
+
+def _from_results(model, rows, **kwargs):
+    return lambda: model.from_results(rows, **kwargs)
+
+
+def _to_json(model, rows, **kwargs):
+    return lambda: model.results_to_json(rows, **kwargs)
+
+
+def _shared(model, rows):
+    # Repeated query, with every instance already in the identity map.
+    identity_map = IdentityMap(maxsize=len(rows) * 4)
+    model.from_results(rows, identity_map=identity_map)
+    return lambda: model.from_results(rows, identity_map=identity_map)
+
+
+def _from_rows(model, rows):
+    columns = list(rows[0])
+    tuples = [tuple(row.values()) for row in rows]
+    return lambda: model.from_rows(tuples, columns=columns)
+
+
+def _sqlite(parents, children, row_factory=None):
+    db = data.sqlite_db(parents, children)
+    db.row_factory = row_factory
+
+    def run():
+        cursor = db.execute(data.SQLITE_QUERY)
+        if row_factory is None:
+            return ModelF.from_rows(cursor.fetchall(), columns=cursor.description)
+        return ModelF.from_results(cursor.fetchall())
+
+    return run
+
+
+def _sqlite_cursor(parents, children):
+    db = data.sqlite_db(parents, children)
+    return lambda: sum(1 for _ in ModelF.from_cursor(db.execute(data.SQLITE_QUERY), batch_size=1000))
+
+
+SCENARIOS = [
+    Scenario("flat", lambda: _from_results(ModelA, data.flat_rows(ROWS))),
+    Scenario("flat_wide", lambda: _from_results(ModelA, data.flat_rows(ROWS, extra_columns=20))),
+    Scenario("flat_rows", lambda: _from_rows(ModelA, data.flat_rows(ROWS))),
+    Scenario("optional_join", lambda: _from_results(ModelD, data.optional_rows(ROWS))),
+    Scenario("depth_2", lambda: _from_results(ModelD, data.nested_rows(ROWS, depth=2))),
+    Scenario("depth_3", lambda: _from_results(ModelE, data.nested_rows(ROWS, depth=3))),
+    Scenario("depth_3_records", lambda: _from_results(ModelE, data.nested_rows(ROWS, depth=3), as_records=True)),
+    Scenario("depth_3_shared", lambda: _shared(ModelE, data.nested_rows(ROWS, depth=3))),
+    Scenario("depth_3_json", lambda: _to_json(ModelE, data.nested_rows(ROWS, depth=3))),
+    Scenario("depth_3_json_trusted", lambda: _to_json(ModelE, data.nested_rows(ROWS, depth=3), validate=False)),
+    Scenario("fanout_10", lambda: _from_results(ModelF, data.list_rows(ROWS // 10, 10))),
+    Scenario("fanout_1000", lambda: _from_results(ModelF, data.list_rows(ROWS // 1000, 1000))),
+    Scenario("fanout_10_presorted", lambda: _from_results(ModelF, data.list_rows(ROWS // 10, 10), presorted=True)),
+    Scenario("tree_3", lambda: _from_results(ModelH, data.tree_rows(ROWS // 100, 10, 10))),
+    Scenario("tree_3_narrow", lambda: _from_results(ModelH, data.tree_rows(ROWS // 10, 10, 1))),
+    Scenario("sqlite_rows", lambda: _sqlite(ROWS // 10, 10)),
+    Scenario("sqlite_row_factory", lambda: _sqlite(ROWS // 10, 10, row_factory=sqlite3.Row)),
+    Scenario("sqlite_cursor", lambda: _sqlite_cursor(ROWS // 10, 10)),
+]
@@ -1,22 +1,667 @@
 from __future__ import annotations
 
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import functools
+import inspect
+import itertools
+import operator
+import os
+import time
 import types
 import typing
-from collections import defaultdict
 
 import pydantic
+import pydantic.dataclasses
+import pydantic.fields
+import pydantic_core
+from pydantic_core import PydanticUndefined
+
+from pydantic_db import profiling
+from pydantic_db.identity import IdentityMap, IdentityMapStats
+from pydantic_db.pg_copy import CopyEncoder
+from pydantic_db.profiling import StageTiming, _profilers, add_profiler, profile, remove_profiler
+
+__all__ = [
+    "CopyEncoder",
+    "IdentityMap",
+    "IdentityMapStats",
+    "LazyModel",
+    "Model",
+    "ModelConfig",
+    "ParallelHydrator",
+    "StageTiming",
+    "add_profiler",
+    "profile",
+    "remove_profiler",
+]
 
 DictConvertible = typing.Mapping[str, typing.Any] | typing.Iterable[tuple[str, typing.Any]]
+# Column names, or a DB-API `cursor.description` (sequences with the column name first).
+Columns = typing.Sequence[str] | typing.Sequence[typing.Sequence[typing.Any]]
+M = typing.TypeVar("M", bound="Model")
+
+
+def _as_dict(result: DictConvertible) -> dict[str, typing.Any]:
+    """Convert a database result to a dict, if it is not one already."""
+    return result if isinstance(result, dict) else dict(result)  # ty: ignore[invalid-return-type]
+
+
+def _column_names(columns: Columns) -> tuple[str, ...]:
+    """Extract column names from a list of names or a DB-API cursor description."""
+    return tuple(column if isinstance(column, str) else column[0] for column in columns)
+
+
+def _positional(results: typing.Iterable[DictConvertible]) -> tuple[tuple[str, ...], list[tuple]] | None:
+    """Convert results to column names and positional rows, or None if the columns differ between results."""
+    columns: tuple[str, ...] = ()
+    rows = []
+    for result in results:
+        row = _as_dict(result)
+        if not rows:
+            columns = tuple(row)
+        elif tuple(row) != columns:
+            return None
+        rows.append(tuple(row.values()))
+
+    return columns, rows
+
+
+def _canonical_key(value: typing.Any) -> typing.Hashable:  # noqa: ANN401
+    """Convert parsed result data to a hashable (and key order independent) representation."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonical_key(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_canonical_key(v) for v in value)
+    return value
+
+
+def _repeated(values: list[dict], key: typing.Callable[[dict], typing.Hashable]) -> dict[int, dict]:
+    """Find repeated parsed results, mapping the id of each repeat to the equal result it repeats.
+
+    Results are keyed by `key` (falling back to the full result), and only
+    compared with the last result seen with the same key.
+    """
+    keys: list[typing.Hashable]
+    try:
+        keys = list(map(key, values))
+        last = dict(zip(keys, values, strict=True))
+    except (KeyError, TypeError):
+        try:
+            keys = list(map(_canonical_key, values))
+            last = dict(zip(keys, values, strict=True))
+        except TypeError:
+            return {}
+
+    if len(last) == len(keys):
+        return {}
+
+    repeated = {}
+    for value_key, value in zip(keys, values, strict=True):
+        seen = last[value_key]
+        if seen is not value and seen == value:
+            repeated[id(value)] = seen
+    return repeated
+
+
+def _path_getter(path: tuple[str, ...]) -> typing.Callable[[typing.Any], typing.Any]:
+    """Build a getter for a (nested) attribute path, returning None if any parent is None."""
+    if len(path) == 1:
+        return operator.attrgetter(path[0])
+
+    def get(value: typing.Any) -> typing.Any:  # noqa: ANN401
+        for name in path:
+            if value is None:
+                return None
+            value = getattr(value, name)
+        return value
+
+    return get
+
+
+class KeyGetters(typing.NamedTuple):
+    """Identity key extractors for a model instance, or dict representation of a model."""
+
+    instance: typing.Callable[[typing.Any], tuple]
+    data: typing.Callable[[dict], tuple]
+    cache_hash: bool
+
+
+# Instance `__dict__` key for the cached hash of frozen models.
+_CACHED_HASH = "_pdb_hash"
 
 
 class ModelConfig(typing.NamedTuple):
     """Simple configuration to track details extracted from annotations."""
 
-    model: Model
+    model: type[Model]
     optional: bool
     is_list: bool
 
 
+class ChildPlan(typing.NamedTuple):
+    """Compiled routing of result columns to a nested model field."""
+
+    field: str
+    config: ModelConfig
+    value_index: int | None
+    skip_index: int | None
+    nullable: bool
+    plan: ResultPlan
+
+
+class ResultPlan(typing.NamedTuple):
+    """Compiled mapping of result column positions to (nested) model fields.
+
+    A plan is compiled once per model, prefix and set of result columns, so
+    parsing a row only routes values by position.
+    """
+
+    columns: tuple[tuple[str, int], ...]
+    children: tuple[ChildPlan, ...]
+
+    def parse(self, values: typing.Sequence[typing.Any]) -> dict:
+        """Route a row of positional values into a (nested) dict."""
+        data = {key: values[index] for key, index in self.columns}
+        for child in self.children:
+            value = None if child.value_index is None else values[child.value_index]
+            if value:
+                # Pre aggregated (i.e. json) child data.
+                model = child.config.model
+                data[child.field] = (
+                    model._parse_results(value)  # noqa: SLF001
+                    if isinstance(value, list)
+                    else model._parse_result(value)  # noqa: SLF001
+                )
+            elif child.nullable and (child.skip_index is None or values[child.skip_index] is None):
+                data[child.field] = None
+            else:
+                data[child.field] = child.plan.parse(values)
+
+        return data
+
+
+EMPTY_PLAN = ResultPlan((), ())
+
+
+class JsonPlan(typing.NamedTuple):
+    """Compiled mapping of parsed result keys to the serialized fields of a model.
+
+    Used to serialize unvalidated results with the field names, exclusions and
+    defaults of a validated dump, see `Model.results_to_json`. Models with
+    serializers or computed fields are not `serializable` without validation.
+    """
+
+    fields: tuple[tuple[tuple[str, ...], str, pydantic.fields.FieldInfo], ...]
+    children: tuple[tuple[str, type[Model], bool], ...]
+    serializable: bool
+
+    def apply(self, data: list[dict]) -> list[dict]:
+        """Rename, filter and default parsed results to match a validated dump."""
+        rows = []
+        for row in data:
+            out = {}
+            for keys, name, field_data in self.fields:
+                for key in keys:
+                    if key in row:
+                        out[name] = row[key]
+                        break
+                else:
+                    default = field_data.get_default(call_default_factory=True)
+                    if default is not PydanticUndefined:
+                        out[name] = default
+            for name, model, is_list in self.children:
+                value = out.get(name)
+                if is_list and isinstance(value, list):
+                    out[name] = model._json_plan().apply(value)  # noqa: SLF001
+                elif not is_list and isinstance(value, dict):
+                    out[name] = model._json_plan().apply([value])[0]  # noqa: SLF001
+            rows.append(out)
+
+        return rows
+
+
+class ResultParser:
+    """Parse database results for a model.
+
+    Rows in a result set share their columns, so the result plan is only
+    looked up again if the columns change. If `columns` are provided, results
+    are positional rows (i.e. tuples) parsed with a fixed result plan.
+    """
+
+    def __init__(self, model: type[Model], *, prefix: str = "", columns: Columns | None = None) -> None:
+        self.model = model
+        self.prefix = prefix
+        self.columns: tuple[str, ...] | None = None
+        self.plan = EMPTY_PLAN
+        self.positional = columns is not None
+        if columns is not None:
+            self.columns = _column_names(columns)
+            self.plan = model._result_plan(self.columns, prefix=prefix)  # noqa: SLF001
+        # Parse timings of streamed results, accumulated while profiling.
+        self.rows = 0
+        self.seconds = 0.0
+
+    def __call__(self, result: DictConvertible) -> dict:
+        """Parse a single streamed result."""
+        if not _profilers:
+            return self.parse(result)
+
+        start = time.perf_counter()
+        data = self.parse(result)
+        self.rows += 1
+        self.seconds += time.perf_counter() - start
+        return data
+
+    def parse(self, result: DictConvertible) -> dict:
+        if self.positional:
+            return self.plan.parse(result)  # ty: ignore[invalid-argument-type]
+
+        row = _as_dict(result)
+        columns = tuple(row)
+        if columns != self.columns:
+            self.columns, self.plan = columns, self.model._result_plan(columns, prefix=self.prefix)  # noqa: SLF001
+        return self.plan.parse(tuple(row.values()))
+
+    def parse_all(self, results: typing.Iterable[typing.Any]) -> list[dict]:
+        """Parse a result set."""
+        parse: typing.Callable[[typing.Any], dict] = self.plan.parse if self.positional else self.parse
+        if not _profilers:
+            return list(map(parse, results))
+
+        start = time.perf_counter()
+        data = list(map(parse, results))
+        profiling.record("parse", self.model, len(data), len(data), time.perf_counter() - start)
+        return data
+
+    def report(self) -> None:
+        """Report accumulated parse timings of streamed results."""
+        if _profilers and self.rows:
+            profiling.record("parse", self.model, self.rows, self.rows, self.seconds)
+        self.rows, self.seconds = 0, 0.0
+
+
+def _not_ordered(model: type[Model], key: typing.Hashable) -> ValueError:
+    """Error for results not ordered by the parent object."""
+    return ValueError(f"Results are not ordered by {model.__name__}, rows for {key} are not adjacent.")
+
+
+class ResultGrouper:
+    """Group a stream of parsed results by parent object.
+
+    Models without `list[Model]` fields are complete after a single row. For
+    models with list fields rows must be ordered by the parent object, a parent
+    is complete once a row for a different parent is seen.
+
+    With `check_sorted=True` the keys of completed parents are kept, and a
+    ValueError raised if a row for a completed parent is seen. Otherwise only
+    the rows of the current parent are held, so memory use is constant.
+    """
+
+    def __init__(self, model: type[Model], *, check_sorted: bool = False) -> None:
+        self.model = model
+        self.grouped = any(config.is_list for config in model._pdb_model_fields().values())  # noqa: SLF001
+        self.key: tuple | None = None
+        self.rows: list[dict] = []
+        self.completed: set[tuple] | None = set() if check_sorted else None
+
+    def push(self, row: dict) -> list[dict]:
+        """Add a parsed result, returning the results of a completed parent (if any)."""
+        if not self.grouped:
+            return [row]
+
+        complete = []
+        key = self.model._dict_key(row)  # noqa: SLF001
+        if self.rows and key != self.key:
+            if self.completed is not None:
+                self.completed.add(typing.cast("tuple", self.key))
+                if key in self.completed:
+                    raise _not_ordered(self.model, key)
+            complete, self.rows = self.rows, []
+        self.key = key
+        self.rows.append(row)
+        return complete
+
+    def push_many(self, rows: list[dict]) -> list[dict]:
+        """Add a batch of parsed results, returning the results of all completed parents."""
+        if not self.grouped:
+            return rows
+
+        complete = []
+        for row in rows:
+            complete.extend(self.push(row))
+        return complete
+
+    def flush(self) -> list[dict]:
+        """Return the results of the final parent."""
+        complete, self.rows = self.rows, []
+        return complete
+
+
+def _prepare_single(model: type[Model], data: dict) -> dict:
+    """Populate the nested fields of a single parsed result, as a `_ResultTree` of one result would."""
+    for model_prefix, config in model._tree_fields()[0]:  # noqa: SLF001
+        value = data.get(model_prefix)
+        if isinstance(value, list):
+            data[model_prefix] = config.model._prepare(value)  # noqa: SLF001
+        elif value:
+            result = _prepare_single(config.model, value)
+            data[model_prefix] = [result] if config.is_list else result
+        elif config.is_list and not config.optional:
+            data[model_prefix] = []
+
+    return data
+
+
+class _ResultTree:
+    """Distinct parsed results of a model, and the distinct nested results of each.
+
+    Results are pushed a row at a time, merging nested results into the
+    matching result at each level of nesting, so the whole tree is built in a
+    single pass over the rows. With `merge=True` (models with list fields)
+    results are matched by `_hash_fields` key, otherwise equal results are
+    matched, or with `merge=None` every result is kept.
+
+    `presorted` results (with `merge=True`) must be ordered by key, each
+    result is only matched with the previous result, and populated as soon
+    as a different key is seen. With `check_sorted=True` the keys of
+    completed results are kept, and a ValueError raised if a result for a
+    completed key is seen.
+    """
+
+    __slots__ = (
+        "check_sorted",
+        "children",
+        "fields",
+        "key",
+        "keys",
+        "last",
+        "merge",
+        "model",
+        "populated",
+        "presorted",
+        "results",
+    )
+
+    def __init__(
+        self,
+        model: type[Model],
+        *,
+        merge: bool | None,
+        presorted: bool = False,
+        check_sorted: bool = False,
+    ) -> None:
+        self.model = model
+        self.merge = merge
+        self.presorted = presorted
+        self.check_sorted = check_sorted
+        self.last: typing.Hashable = None
+        self.key = model._key_getters().data  # noqa: SLF001
+        self.fields = model._tree_fields()[0]  # noqa: SLF001
+        self.keys: dict[typing.Hashable, typing.Any] = {}
+        self.results: list[dict] = []
+        # Nested results of each field (pre-aggregated lists are kept as is, as is a single
+        # nested result, see `_ResultTree.push`), aligned with the results. Nested results
+        # are released once a result is populated, results are populated in order.
+        self.children: list[list[_ResultTree | dict | list | None]] = [[] for _ in self.fields]
+        self.populated = 0
+
+    def _append(self, data: dict) -> int:
+        """Add a distinct result, returning its index."""
+        self.results.append(data)
+        for nested in self.children:
+            nested.append(None)
+        return len(self.results) - 1
+
+    def _distinct_index(self, data: dict) -> int:
+        """Find the index of a result equal to a parsed result, adding it if not found.
+
+        Results are bucketed by key, so only results sharing a key are compared.
+        """
+        try:
+            try:
+                key = self.key(data)
+            except KeyError:
+                key = _canonical_key(data)
+            bucket = self.keys.setdefault(key, [])
+        except TypeError:
+            # Unhashable result data, fall back to an equality scan.
+            bucket = self.keys.setdefault(None, [])
+        for index in bucket:
+            if self.results[index] == data:
+                return index
+
+        index = self._append(data)
+        bucket.append(index)
+        return index
+
+    def _index(self, data: dict) -> int:
+        """Find the index of the result matching a parsed result, adding it if not found."""
+        if self.merge and self.presorted:
+            key = self.key(data)
+            index = len(self.results) - 1
+            if index < 0 or key != self.last:
+                index = self._next(key, data)
+        elif self.merge:
+            key = self.key(data)
+            index = self.keys.get(key)
+            if index is None:
+                index = self.keys[key] = self._append(data)
+        elif self.merge is None:
+            index = self._append(data)
+        else:
+            index = self._distinct_index(data)
+        return index
+
+    def push(self, data: dict) -> None:
+        """Add a parsed result, merging its nested results into the matching result."""
+        index = self._index(data)
+        for (model_prefix, config), nested in zip(self.fields, self.children, strict=True):
+            value = data.get(model_prefix)
+            if not value:
+                continue
+
+            child = nested[index]
+            if child is None:
+                # Narrow fan outs are common, a tree is only built once a second nested result is seen.
+                nested[index] = value
+            elif type(child) is _ResultTree:
+                child.push(value)
+            elif type(child) is dict and type(value) is dict:
+                merge = config.model._tree_fields()[1]  # noqa: SLF001
+                tree = nested[index] = _ResultTree(config.model, merge=merge)
+                tree.push(child)
+                tree.push(value)
+            else:
+                nested[index] = value
+
+    def _next(self, key: typing.Hashable, data: dict) -> int:
+        """Add the first result for a key of presorted results, populating the previous result."""
+        if self.results:
+            self._populate(len(self.results) - 1)
+            if self.check_sorted:
+                self.keys[self.last] = None
+                if key in self.keys:
+                    raise _not_ordered(self.model, key)
+
+        self.last = key
+        return self._append(data)
+
+    def _populate(self, index: int) -> None:
+        """Populate the nested fields of a result, releasing its nested results."""
+        data = self.results[index]
+        for (model_prefix, config), nested in zip(self.fields, self.children, strict=True):
+            child, nested[index] = nested[index], None
+            if isinstance(child, _ResultTree):
+                results = child.build()
+                data[model_prefix] = results if config.is_list else results[0]
+            elif isinstance(child, list):
+                data[model_prefix] = config.model._prepare(child)  # noqa: SLF001
+            elif isinstance(child, dict):
+                result = _prepare_single(config.model, child)
+                data[model_prefix] = [result] if config.is_list else result
+            elif config.is_list and not config.optional:
+                # Populate non nullable list fields without child data with the default list.
+                data[model_prefix] = []
+
+        self.populated = index + 1
+
+    def build(self) -> list[dict]:
+        """Populate the nested fields of each distinct result, returning the results."""
+        if self.fields:
+            for index in range(self.populated, len(self.results)):
+                self._populate(index)
+
+        return self.results
+
+
+def _hydrate_chunk(
+    model: type[Model],
+    columns: tuple[str, ...],
+    rows: list[tuple],
+    prefix: str,
+) -> list[Model]:
+    """Hydrate a chunk of positional rows, in a worker process."""
+    return model.from_rows(rows, columns, prefix=prefix)
+
+
+class ParallelHydrator:
+    """Hydrate large result sets across a pool of worker processes.
+
+    Results are sent to workers as positional rows along with their column
+    names, rather than as dicts. All rows of a parent object (identified by
+    the model `_hash_fields`) are sent to the same worker, so child lists are
+    never split across chunks, and models are returned in the order they
+    first appear in the result set.
+
+    Models must be importable by the worker processes, i.e. defined at module
+    level. Result sets too small to split into chunks of `min_chunk_size`
+    rows are hydrated in process.
+    """
+
+    chunks_per_worker = 4
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        min_chunk_size: int = 1000,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.min_chunk_size = min_chunk_size
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the process pool, if it was created by the hydrator."""
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def _executor(self) -> concurrent.futures.Executor:
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+        return self.executor
+
+    def from_results(
+        self,
+        model: type[M],
+        results: typing.Sequence[DictConvertible],
+        *,
+        prefix: str = "",
+    ) -> list[M]:
+        """Convert a result set to a list of model instances, see `Model.from_results`."""
+        self._check_model(model)
+        positional = _positional(results)
+        if positional is None:
+            # Rows with differing columns can't be sent positionally.
+            return model.from_results(results, prefix=prefix)
+
+        columns, rows = positional
+        return self.from_rows(model, rows, columns, prefix=prefix)
+
+    def from_rows(
+        self,
+        model: type[M],
+        rows: typing.Iterable[typing.Sequence[typing.Any]],
+        columns: Columns,
+        *,
+        prefix: str = "",
+    ) -> list[M]:
+        """Convert a result set of positional rows to a list of model instances, see `Model.from_rows`."""
+        self._check_model(model)
+        columns = _column_names(columns)
+        rows = rows if isinstance(rows, list) else list(rows)
+        chunks = self._chunks(model, rows, columns, prefix)
+        if len(chunks) < 2:  # noqa: PLR2004
+            return model.from_rows(rows, columns, prefix=prefix)
+
+        hydrated = self._executor().map(
+            _hydrate_chunk,
+            itertools.repeat(model),
+            itertools.repeat(columns),
+            chunks,
+            itertools.repeat(prefix),
+        )
+        return [instance for chunk in hydrated for instance in chunk]  # ty: ignore[invalid-return-type]
+
+    @staticmethod
+    def _check_model(model: type[Model]) -> None:
+        """Reject models that can't be pickled for worker processes."""
+        if model._projection_origin is not None:  # noqa: SLF001
+            msg = "Projections can not be hydrated by worker processes."
+            raise ValueError(msg)
+
+    def _chunks(
+        self,
+        model: type[Model],
+        rows: list[typing.Sequence[typing.Any]],
+        columns: tuple[str, ...],
+        prefix: str,
+    ) -> list[list[typing.Sequence[typing.Any]]]:
+        """Split rows into chunks, keeping the rows of each parent object together."""
+        count = min(self.workers * self.chunks_per_worker, len(rows) // self.min_chunk_size)
+        if count < 2:  # noqa: PLR2004
+            return [rows]
+
+        size = -(-len(rows) // count)
+        if not any(config.is_list for config in model._pdb_model_fields().values()):  # noqa: SLF001
+            # Every row is a complete parent object.
+            return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+        indexes = dict(model._result_plan(columns, prefix=prefix).columns)  # noqa: SLF001
+        fields = sorted(model._hash_fields)  # noqa: SLF001
+        if not fields or any(field not in indexes for field in fields):
+            # Parent objects can't be identified from the raw rows.
+            return [rows]
+
+        key = operator.itemgetter(*(indexes[field] for field in fields))
+        groups: dict[typing.Hashable, list[typing.Sequence[typing.Any]]] = {}
+        for row in rows:
+            groups.setdefault(key(row), []).append(row)
+
+        chunks, chunk = [], []
+        for group in groups.values():
+            chunk.extend(group)
+            if len(chunk) >= size:
+                chunks.append(chunk)
+                chunk = []
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+
 class Model(pydantic.BaseModel):
     """Base model class.
 
@@ -28,7 +673,29 @@ class Model(pydantic.BaseModel):
     _skip_prefix_fields: typing.ClassVar[dict[str, str] | None] = None
     _skip_sortable_fields: typing.ClassVar[set[str] | None] = None
     _hash_fields: typing.ClassVar[set[str]] = {"id"}
+    _cached_needs_prepare: typing.ClassVar[bool | None] = None
+    _cached_sharing: typing.ClassVar[tuple[bool, bool] | None] = None
+    _cached_tree_fields: typing.ClassVar[tuple[tuple[tuple[str, ModelConfig], ...], bool] | None] = None
+    _cached_list_adapter: typing.ClassVar[pydantic.TypeAdapter | None] = None
+    _cached_json_plan: typing.ClassVar[JsonPlan | None] = None
     _cached_model_fields: typing.ClassVar[dict[str, ModelConfig] | None] = None
+    _cached_result_plans: typing.ClassVar[dict[tuple[str, tuple[str, ...]], ResultPlan] | None] = None
+
+    _cached_key_getters: typing.ClassVar[KeyGetters | None] = None
+    _cached_columns: typing.ClassVar[dict[str | None, tuple[tuple[str, ...], ...]] | None] = None
+    _cached_typed_columns: typing.ClassVar[dict[str | None, dict[tuple[str, ...], type[typing.Any] | None]] | None] = (
+        None
+    )
+    _lazy_origin: typing.ClassVar[type[Model] | None] = None
+    _projection_origin: typing.ClassVar[type[Model] | None] = None
+    _projection_cache_size: typing.ClassVar[int] = 128
+    _cached_lazy_model: typing.ClassVar[type[Model] | None] = None
+    _cached_record_class: typing.ClassVar[type | None] = None
+    _cached_record_adapter: typing.ClassVar[pydantic.TypeAdapter | None] = None
+    _cached_projections: typing.ClassVar[collections.OrderedDict[frozenset[str], type[Model]] | None] = None
+    _cached_row_getters: typing.ClassVar[dict[tuple[str, ...] | None, typing.Callable[[Model], tuple]] | None] = None
+    _cached_select_columns: typing.ClassVar[dict[tuple[tuple[str, str], ...], str] | None] = None
+    _cached_sortable_fields: typing.ClassVar[dict[bool, tuple[tuple[str, ...], frozenset[str]]] | None] = None
 
     def __hash__(self) -> int:
         """Generate a unique hash for a model.
@@ -36,8 +703,63 @@ class Model(pydantic.BaseModel):
         By default will hash the `id` field of a model, to override this
         behaviour define the unique set of fields to hash with the class var
         `_hash_fields`.
+
+        The hash of frozen models is cached on the instance.
+        """
+        getters = self._key_getters()
+        if not getters.cache_hash:
+            return hash(getters.instance(self))
+
+        hash_ = self.__dict__.get(_CACHED_HASH)
+        if hash_ is None:
+            hash_ = self.__dict__[_CACHED_HASH] = hash(getters.instance(self))
+        return hash_
+
+    def __getstate__(self) -> dict[typing.Any, typing.Any]:
+        """Exclude cached hashes from pickled state, hashes are not stable across processes."""
+        state = super().__getstate__()
+        if _CACHED_HASH in self.__dict__:
+            state["__dict__"] = {k: v for k, v in self.__dict__.items() if k != _CACHED_HASH}
+        return state
+
+    def model_copy(self, *, update: typing.Mapping[str, typing.Any] | None = None, deep: bool = False) -> typing.Self:
+        """Copy a model, discarding any cached hash if fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop(_CACHED_HASH, None)
+        return copied
+
+    @classmethod
+    def _key_getters(cls) -> KeyGetters:
+        """Fetch (or build and cache) identity key extractors for the model `_hash_fields`.
+
+        Fields are sorted so keys are ordered consistently across processes.
+        """
+        getters = cls.__dict__.get("_cached_key_getters")
+        if getters is None:
+            fields = sorted(cls._hash_fields)
+            if len(fields) == 1:
+                (field,) = fields
+                instance_getter = lambda model: (getattr(model, field),)  # noqa: E731
+                data_getter = lambda data: (data[field],)  # noqa: E731
+            elif fields:
+                instance_getter = operator.attrgetter(*fields)
+                data_getter = operator.itemgetter(*fields)
+            else:
+                instance_getter = data_getter = lambda _: ()
+
+            getters = KeyGetters(instance_getter, data_getter, cache_hash=bool(cls.model_config.get("frozen")))
+            cls._cached_key_getters = getters
+
+        return getters
+
+    @classmethod
+    def _dict_key(cls, data: dict) -> tuple:
+        """Generate the identity key for a dict representation of a model.
+
+        See __hash__ for details.
         """
-        return hash("".join([str(getattr(self, field)) for field in self._hash_fields]))
+        return cls._key_getters().data(data)
 
     @classmethod
     def _dict_hash(cls, data: dict) -> int:
@@ -45,7 +767,7 @@ class Model(pydantic.BaseModel):
 
         See __hash__ for details.
         """
-        return hash("".join([str(data[field]) for field in cls._hash_fields]))
+        return hash(cls._dict_key(data))
 
     @classmethod
     def _process_list(
@@ -91,7 +813,8 @@ class Model(pydantic.BaseModel):
         Determine if a field refers to a Model, if it is optional and if it is
         list based (in need of flattening to maintain top level uniqueness.
         """
-        if cls._cached_model_fields is None:
+        model_fields = cls.__dict__.get("_cached_model_fields")
+        if model_fields is None:
             ret = {}
             type_hints = typing.get_type_hints(cls)
             for field in cls.model_fields:
@@ -107,9 +830,9 @@ class Model(pydantic.BaseModel):
                 elif isinstance(annotation, type) and issubclass(annotation, Model):
                     ret[field] = ModelConfig(annotation, optional=False, is_list=False)
 
-            cls._cached_model_fields = ret
+            cls._cached_model_fields = model_fields = ret
 
-        return cls._cached_model_fields
+        return model_fields
 
     def __eq__(self, other: object) -> bool:
         """Check model equality.
@@ -117,8 +840,13 @@ class Model(pydantic.BaseModel):
         By default equality checks all fields of a model are equal. To override
         this behaviour set the class var `_eq_excluded_fields` to define fields
         that can be ignored when checking equality.
+
+        Lazy instances are equal to instances of the model they are a lazy
+        variant of.
         """
-        if type(self) is type(other):
+        if type(self) is type(other) or (
+            isinstance(other, Model) and (self._lazy_origin or type(self)) is (other._lazy_origin or type(other))
+        ):
             return all(
                 getattr(self, field) == getattr(other, field)
                 for field in type(self).model_fields
@@ -127,33 +855,218 @@ class Model(pydantic.BaseModel):
         return False
 
     @classmethod
-    def _parse_result(cls: type[typing.Self], result: DictConvertible, *, prefix: str = "") -> dict:
-        """Convert a database result representation to a dict.
+    def _known_columns(cls) -> set[str] | None:
+        """Result columns that map to fields of a projection, or None if all columns are kept.
 
-        Additionally parse any `model_prefix__*` fields to a `model_prefix`
-        dictionary containing child fields.
+        Columns outside a projection are skipped when parsing, unless extra
+        columns are not ignored by the model, or model validators (before or
+        wrap) may read them.
+        """
+        if cls._projection_origin is None or cls.model_config.get("extra", "ignore") != "ignore":
+            return None
+        if any(
+            decorator.info.mode in {"before", "wrap"}
+            for decorator in cls.__pydantic_decorators__.model_validators.values()
+        ):
+            return None
+
+        columns = set()
+        for field, field_data in cls.model_fields.items():
+            if not isinstance(field_data.validation_alias, str | None):
+                # Alias paths/choices can't be mapped to a column name.
+                return None
+            columns.update(name for name in (field, field_data.alias, field_data.validation_alias) if name)
+
+        return columns
+
+    @classmethod
+    def projection(cls, include: typing.Iterable[str]) -> type[Model]:
+        """Fetch (or build and cache) a model containing only the `include`d fields.
+
+        Fields are `__` separated names, as in `Model.sortable_fields`. A
+        nested model field is included in full, or with only the selected sub
+        fields. The `_hash_fields` of each model are always included.
+
+        Projections are separate model classes, built from the field
+        definitions, configuration and validators of the model (field
+        validators only for included fields). The most recently used
+        `_projection_cache_size` projections are cached.
         """
-        # Strip prefixes away
-        data = {k.replace(f"{prefix}", ""): v for k, v in dict(result).items() if k.startswith(prefix)}
+        include = frozenset(include)
+        cache = cls.__dict__.get("_cached_projections")
+        if cache is None:
+            cache = collections.OrderedDict()
+            cls._cached_projections = cache
+
+        projection = cache.get(include)
+        if projection is None:
+            projection = cache[include] = cls._compile_projection(include)
+            while len(cache) > cls._projection_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(include)
+
+        return projection
+
+    @classmethod
+    def _compile_projection(cls, include: frozenset[str]) -> type[Model]:
+        """Build a model containing only the `include`d fields, see `Model.projection`."""
+        names = {field_data.alias or field: field for field, field_data in cls.model_fields.items()}
+        model_fields = cls._pdb_model_fields()
+        # Selected fields, and the selected sub fields of nested models (None to include all).
+        selected: dict[str, set[str] | None] = dict.fromkeys(names.get(field, field) for field in cls._hash_fields)
+        for path in include:
+            name, _, child = path.partition("__")
+            field = names.get(name, name)
+            if field not in cls.model_fields or (child and field not in model_fields):
+                msg = f"Unknown field {path!r} for {cls.__name__}."
+                raise ValueError(msg)
+
+            if not child:
+                selected[field] = None
+            elif (children := selected.get(field, set())) is not None:
+                selected[field] = {*children, child}
+
+        annotations, namespace = {}, {}
+        for field, field_data in cls.model_fields.items():
+            if field not in selected:
+                continue
+
+            annotation = field_data.annotation
+            children = selected[field]
+            if children is not None:
+                config = model_fields[field]
+                annotation = config.model.projection(children)
+                if config.is_list:
+                    annotation = list[annotation]  # ty: ignore[invalid-type-form]
+                if config.optional:
+                    annotation = annotation | None
 
+            annotations[field] = annotation
+            namespace[field] = copy.copy(field_data)
+
+        namespace.update(cls._projection_validators(set(selected)))
+        namespace.update(
+            __module__=cls.__module__,
+            __doc__=cls.__doc__,
+            __annotations__=annotations,
+            model_config=cls.model_config.copy(),
+            _eq_excluded_fields=cls._eq_excluded_fields,
+            _skip_prefix_fields=cls._skip_prefix_fields,
+            _skip_sortable_fields=cls._skip_sortable_fields,
+            _hash_fields=cls._hash_fields,
+            _projection_origin=cls,
+        )
+        return types.new_class(f"{cls.__name__}Projection", (Model,), exec_body=lambda ns: ns.update(namespace))
+
+    @classmethod
+    def _projection_validators(cls, fields: set[str]) -> dict[str, typing.Any]:
+        """Rebuild the model and field validators of the model for a projection containing `fields`."""
+        decorators = cls.__pydantic_decorators__
+        validators = {}
+        for name, decorator in decorators.field_validators.items():
+            validated = [field for field in decorator.info.fields if field in fields or field == "*"]
+            if validated:
+                kwargs = {}
+                if decorator.info.json_schema_input_type is not PydanticUndefined:
+                    kwargs["json_schema_input_type"] = decorator.info.json_schema_input_type
+                validators[name] = pydantic.field_validator(*validated, mode=decorator.info.mode, **kwargs)(
+                    inspect.getattr_static(cls, decorator.cls_var_name),
+                )
+        for name, decorator in decorators.model_validators.items():
+            validators[name] = pydantic.model_validator(mode=decorator.info.mode)(
+                inspect.getattr_static(cls, decorator.cls_var_name),
+            )
+
+        return validators
+
+    @classmethod
+    def _compile_result_plan(cls: type[typing.Self], columns: typing.Iterable[tuple[str, int]]) -> ResultPlan:
+        """Compile a mapping of (prefix stripped) column names and positions to fields.
+
+        Any `model_prefix__*` columns are routed to the nested model for
+        `model_prefix`, recursively.
+        """
         skip_prefix_map = cls._skip_prefix_fields or {}
         model_fields = cls._pdb_model_fields()
 
+        nested_columns: dict[str, list[tuple[str, int]]] = {model_prefix: [] for model_prefix in model_fields}
+        value_columns: dict[str, int] = {}
+        scalar_columns = []
+        known_columns = cls._known_columns()
+        for name, index in columns:
+            model_prefix, sep, child_name = name.partition("__")
+            if sep and model_prefix in nested_columns:
+                nested_columns[model_prefix].append((child_name, index))
+            elif name in model_fields:
+                value_columns[name] = index
+            elif known_columns is None or name in known_columns:
+                scalar_columns.append((name, index))
+
+        children = []
         for model_prefix, config in model_fields.items():
+            child_columns = nested_columns[model_prefix]
             skip_field = skip_prefix_map.get(model_prefix, "id")
-            if data.get(model_prefix):
-                continue
-            if (config.optional or config.is_list) and data.get(f"{model_prefix}__{skip_field}") is None:
-                data[model_prefix] = None
-            else:
-                data[model_prefix] = {
-                    k.replace(f"{model_prefix}__", ""): v for k, v in data.items() if k.startswith(f"{model_prefix}__")
-                }
+            skip_index = next((index for name, index in child_columns if name == skip_field), None)
+            children.append(
+                ChildPlan(
+                    model_prefix,
+                    config,
+                    value_columns.get(model_prefix),
+                    skip_index,
+                    config.optional or config.is_list,
+                    # Guard against recursing through circular references with no columns.
+                    config.model._compile_result_plan(child_columns) if child_columns else EMPTY_PLAN,  # noqa: SLF001
+                ),
+            )
 
-        return data
+        return ResultPlan(tuple(scalar_columns), tuple(children))
+
+    @classmethod
+    def _result_plan(cls: type[typing.Self], columns: tuple[str, ...], *, prefix: str = "") -> ResultPlan:
+        """Fetch (or compile and cache) the result plan for a set of result columns."""
+        plans = cls.__dict__.get("_cached_result_plans")
+        if plans is None:
+            plans = {}
+            cls._cached_result_plans = plans
+
+        key = (prefix, columns)
+        plan = plans.get(key)
+        if plan is None:
+            plan = cls._compile_result_plan(
+                (column[len(prefix) :], index) for index, column in enumerate(columns) if column.startswith(prefix)
+            )
+            plans[key] = plan
+
+        return plan
+
+    @classmethod
+    def _parse_result(cls: type[typing.Self], result: DictConvertible, *, prefix: str = "") -> dict:
+        """Convert a database result representation to a dict.
+
+        Additionally parse any `model_prefix__*` fields to a `model_prefix`
+        dictionary containing child fields.
+        """
+        row = _as_dict(result)
+        return cls._result_plan(tuple(row), prefix=prefix).parse(tuple(row.values()))
+
+    @classmethod
+    def _parse_results(
+        cls: type[typing.Self],
+        results: typing.Iterable[DictConvertible],
+        *,
+        prefix: str = "",
+    ) -> list[dict]:
+        """Convert database result representations to dicts."""
+        return list(map(ResultParser(cls, prefix=prefix), results))
 
     @classmethod
-    def one(cls: type[typing.Self], data: DictConvertible | list[DictConvertible], *, prefix: str = "") -> typing.Self:
+    def one(
+        cls: type[typing.Self],
+        data: DictConvertible | list[DictConvertible],
+        *,
+        prefix: str = "",
+    ) -> typing.Self:
         """Helper function to process a database result or result set into a single model instance.
 
         When dealing with list based children, a result set will contain a copy
@@ -172,93 +1085,1041 @@ class Model(pydantic.BaseModel):
         return result
 
     @classmethod
-    def all(cls: type[typing.Self], data: list[DictConvertible], *, prefix: str = "") -> typing.Self:
+    def all(
+        cls: type[typing.Self],
+        data: list[DictConvertible],
+        *,
+        prefix: str = "",
+    ) -> list[typing.Self]:
         """Helper function to process a database result set into multiple model instances."""
         return cls.from_results(data, prefix=prefix)
 
     @classmethod
-    def from_result(cls: type[typing.Self], result: DictConvertible, *, prefix: str = "") -> typing.Self:
+    def from_result(  # noqa: PLR0913
+        cls: type[typing.Self],
+        result: DictConvertible,
+        *,
+        prefix: str = "",
+        include: typing.Iterable[str] | None = None,
+        lazy: bool = False,
+        as_records: bool = False,
+        identity_map: IdentityMap | None = None,
+    ) -> typing.Self:
         """Process a single database result object into a Model instance.
 
         If the model contains lists of child Models, use `Model.one(results)`,
         to convert multiple rows to a single instance.
+
+        Only `include`d fields are hydrated if provided, see `Model.projection`.
+        With `lazy=True` nested models are hydrated on first access, and with
+        `as_records=True` a read only record is returned. A shared instance is
+        returned from the `identity_map` for equal results, see
+        `Model.from_results`.
         """
-        data = cls._parse_result(result, prefix=prefix)
-        model_fields = cls._pdb_model_fields()
-        for model_prefix, config in model_fields.items():
-            if data[model_prefix]:
-                value = config.model.from_result(data[model_prefix])
-                data[model_prefix] = [value] if config.is_list else value
+        if include is not None:
+            projection = cls.projection(include)
+            return projection.from_result(
+                result,
+                prefix=prefix,
+                lazy=lazy,
+                as_records=as_records,
+                identity_map=identity_map,
+            )
 
-        return cls(**data)
+        data = ResultParser(cls, prefix=prefix).parse_all([result])
+        return cls._hydrate(data, lazy=lazy, as_records=as_records, identity_map=identity_map, single=True)[0]
 
     @classmethod
-    def _flatten_data(cls: type[typing.Self], data: list[dict], list_fields: dict[str, bool]) -> list[dict]:
-        """Flatten child list fields and maintain uniqueness (and order) of parent objects."""
-        child_data = defaultdict(lambda: defaultdict(list))
-        # Extract all child objects for each parent object
-        for row in data:
-            hash_ = cls._dict_hash(row)
-            for list_field in list_fields:
-                v = row.get(list_field)
-                if isinstance(v, list):
-                    child_data[hash_][list_field] = v
-                elif v and v not in child_data[hash_][list_field]:
-                    child_data[hash_][list_field].append(v)
-
-        # Populate each unique top level object, with the extracted child fields.
-        ret, seen = [], set()
+    def _has_list_fields(cls, seen: set[type[Model]] | None = None) -> bool:
+        """Check if the model, or any nested model, contains `list[Model]` fields."""
+        seen = seen or set()
+        seen.add(cls)
+        return any(
+            config.is_list or (config.model not in seen and config.model._has_list_fields(seen))  # noqa: SLF001
+            for config in cls._pdb_model_fields().values()
+        )
+
+    @classmethod
+    def _prepare(
+        cls: type[typing.Self],
+        data: list[dict],
+        *,
+        presorted: bool = False,
+        check_sorted: bool = False,
+    ) -> list[dict]:
+        """Flatten child list fields of parsed results, at every level of nesting.
+
+        Prepared results contain plain (nested) dicts, and lists of dicts for
+        list fields, so they can be validated in a single call. The tree of
+        distinct results is built in a single pass over the results, see
+        `_ResultTree`, `presorted` results must be ordered by parent object
+        (checked with `check_sorted`).
+        """
+        needs_prepare = cls.__dict__.get("_cached_needs_prepare")
+        if needs_prepare is None:
+            needs_prepare = cls._has_list_fields()
+            cls._cached_needs_prepare = needs_prepare
+
+        if not needs_prepare:
+            return data
+
+        # Parent objects are only unique for models with list fields.
+        tree = _ResultTree(
+            cls,
+            merge=True if cls._tree_fields()[1] else None,
+            presorted=presorted,
+            check_sorted=check_sorted,
+        )
         for row in data:
-            hash_ = cls._dict_hash(row)
-            if hash_ not in seen:
-                for list_field, optional in list_fields.items():
-                    if list_field in child_data[hash_] or not optional:
-                        """
-                        If there is child data, or the field is not nullable,
-                        populate with the child data or the default list if the
-                        key does not exist in the underlying result set.
-                        """
-                        row[list_field] = child_data[hash_][list_field]
-                ret.append(row)
-            seen.add(hash_)
+            tree.push(row)
+        return tree.build()
 
-        return ret
+    @classmethod
+    def _tree_fields(cls) -> tuple[tuple[tuple[str, ModelConfig], ...], bool]:
+        """Fetch (or compile and cache) the nested fields prepared in the result tree, see `_ResultTree`.
+
+        Returns list fields and nested model fields with (nested) list fields,
+        and whether the model has list fields.
+        """
+        tree_fields = cls.__dict__.get("_cached_tree_fields")
+        if tree_fields is None:
+            fields = tuple(
+                (model_prefix, config)
+                for model_prefix, config in cls._pdb_model_fields().items()
+                if config.is_list or config.model._has_list_fields()  # noqa: SLF001
+            )
+            tree_fields = (fields, any(config.is_list for _, config in fields))
+            cls._cached_tree_fields = tree_fields
+
+        return tree_fields
 
     @classmethod
-    def from_results(
+    def _list_adapter(cls: type[typing.Self]) -> pydantic.TypeAdapter[list[typing.Self]]:
+        """Fetch (or build and cache) a TypeAdapter to validate a list of the model."""
+        adapter = cls.__dict__.get("_cached_list_adapter")
+        if adapter is None:
+            adapter = pydantic.TypeAdapter(list[cls])  # ty: ignore[invalid-type-form]
+            cls._cached_list_adapter = adapter
+
+        return adapter
+
+    @classmethod
+    def from_results(  # noqa: PLR0913
         cls: type[typing.Self],
         results: typing.Sequence[DictConvertible],
         *,
         prefix: str = "",
+        workers: int | None = None,
+        include: typing.Iterable[str] | None = None,
+        lazy: bool = False,
+        as_records: bool = False,
+        identity_map: IdentityMap | None = None,
+        presorted: bool = False,
+        check_sorted: bool = False,
     ) -> list[typing.Self]:
         """Convert a result set to a list of model instances.
 
         If the model contains `list[Model]` fields, flatten the data to ensure
         uniqueness and ordering of parent objects.
+
+        Very large result sets can be split across `workers` processes, see
+        `ParallelHydrator`.
+
+        Only `include`d fields are hydrated if provided, see `Model.projection`.
+
+        With `lazy=True` nested model (and list of model) fields keep their
+        parsed results, and are only hydrated on first access or
+        serialization. Lazy instances are a subclass of the model.
+
+        With `as_records=True` results are returned as read only records, a
+        (pydantic) dataclass with `__slots__` mirroring the model fields, for a
+        much smaller memory footprint. Records are hashed and compared as the
+        model would be, but do not include any model methods.
+
+        With an `identity_map` (shared across calls) models (and nested
+        models) are cached by class and `_hash_fields` key, and the cached
+        instance is returned (without validation) for results equal to the
+        results it was built from, see `IdentityMap`.
+
+        If results are ordered by the parent object (i.e. `ORDER BY` the
+        parent key), `presorted=True` groups adjacent rows and flattens each
+        parent as soon as its rows are complete, rather than tracking every
+        parent. With `check_sorted=True` the keys of completed parents are
+        kept, and a ValueError raised if rows for a parent are not adjacent.
         """
-        model_fields = cls._pdb_model_fields()
-        list_fields = {model_prefix: config.optional for model_prefix, config in model_fields.items() if config.is_list}
-        data = [cls._parse_result(r, prefix=prefix) for r in results]
-        if list_fields:
-            data = cls._flatten_data(data, list_fields)
+        if include is not None:
+            projection = cls.projection(include)
+            return projection.from_results(
+                results,
+                prefix=prefix,
+                workers=workers,
+                lazy=lazy,
+                as_records=as_records,
+                identity_map=identity_map,
+                presorted=presorted,
+                check_sorted=check_sorted,
+            )
 
-        results = []
-        for row in data:
-            for model_prefix, config in model_fields.items():
-                if row[model_prefix]:
-                    if config.is_list:
-                        # If the flattened data is a list, pass to the child model to process (including nested models/lists)
-                        row[model_prefix] = config.model.from_results(row[model_prefix])
-                    else:
-                        row[model_prefix] = config.model.from_result(row[model_prefix])
-            results.append(cls(**row))
+        if lazy and as_records:
+            msg = "Lazy results can not be returned as records."
+            raise ValueError(msg)
 
-        return results
+        if workers:
+            if lazy or as_records or identity_map is not None:
+                msg = "Lazy results, records and shared instances can not be hydrated by worker processes."
+                raise ValueError(msg)
+            if presorted or check_sorted:
+                # Workers group the rows of each parent, adjacent or not, so order can't be relied on or checked.
+                msg = "Presorted results can not be hydrated by worker processes."
+                raise ValueError(msg)
+            with ParallelHydrator(workers) as hydrator:
+                return hydrator.from_results(cls, results, prefix=prefix)
+
+        data = ResultParser(cls, prefix=prefix).parse_all(results)
+        return cls._hydrate(
+            data,
+            lazy=lazy,
+            as_records=as_records,
+            identity_map=identity_map,
+            presorted=presorted,
+            check_sorted=check_sorted,
+        )
 
     @classmethod
-    def as_columns(cls, base_table: str | None = None) -> list[tuple[str, ...]]:
+    def iter_results(
+        cls: type[typing.Self],
+        results: typing.Iterable[DictConvertible],
+        *,
+        prefix: str = "",
+        check_sorted: bool = False,
+    ) -> typing.Iterator[typing.Self]:
+        """Lazily convert a result set to model instances, as results are consumed.
+
+        Suitable for iterating server side cursors without holding the full
+        result set in memory. If the model contains `list[Model]` fields, the
+        results must be ordered by the parent object, each parent is yielded
+        once all of its rows have been consumed. Only the rows of the current
+        parent are held, with `check_sorted=True` the keys of completed parents
+        are kept, and a ValueError raised if rows for a parent are not adjacent.
+        """
+        parse = ResultParser(cls, prefix=prefix)
+        grouper = ResultGrouper(cls, check_sorted=check_sorted)
+        for result in results:
+            group = grouper.push(parse(result))
+            if group:
+                parse.report()
+                yield from cls._hydrate(group, presorted=True)
+
+        parse.report()
+        yield from cls._hydrate(grouper.flush(), presorted=True)
+
+    @classmethod
+    async def aiter_results(
+        cls: type[typing.Self],
+        results: typing.AsyncIterable[DictConvertible],
+        *,
+        prefix: str = "",
+        check_sorted: bool = False,
+    ) -> typing.AsyncIterator[typing.Self]:
+        """Lazily convert an asynchronous result set to model instances, as results are consumed.
+
+        Async equivalent of `Model.iter_results`, for asyncpg cursors
+        (`conn.cursor(...)`) or any async iterator. Results are only pulled
+        from the source as models are consumed, for asyncpg cursors the
+        `prefetch` size controls how many rows are fetched at a time.
+        """
+        parse = ResultParser(cls, prefix=prefix)
+        grouper = ResultGrouper(cls, check_sorted=check_sorted)
+        async for result in results:
+            group = grouper.push(parse(result))
+            if group:
+                parse.report()
+                for model in cls._hydrate(group, presorted=True):
+                    yield model
+
+        parse.report()
+        for model in cls._hydrate(grouper.flush(), presorted=True):
+            yield model
+
+    @classmethod
+    def results_to_json(
+        cls: type[typing.Self],
+        results: typing.Sequence[DictConvertible],
+        *,
+        prefix: str = "",
+        validate: bool = True,
+    ) -> bytes:
+        """Convert a result set directly to a JSON array of model instances.
+
+        Equivalent to dumping the models from `Model.from_results` to JSON,
+        without holding on to the model instances. Unvalidated results
+        (`validate=False`) are serialized directly from the parsed results,
+        without building model instances at all, see `JsonPlan`. Field names,
+        excluded fields and defaults match a validated dump, models with
+        serializers or computed fields are always validated.
+        """
+        data = cls._prepare(ResultParser(cls, prefix=prefix).parse_all(results))
+        return cls._dump_json(data, validate=validate)
+
+    @classmethod
+    def iter_results_json(
+        cls: type[typing.Self],
+        results: typing.Iterable[DictConvertible],
+        *,
+        prefix: str = "",
+        validate: bool = True,
+        chunk_size: int = 1000,
+        check_sorted: bool = False,
+    ) -> typing.Iterator[bytes]:
+        """Lazily convert a result set to chunks of a JSON array of model instances, as results are consumed.
+
+        Streaming equivalent of `Model.results_to_json`, parsed results are
+        serialized every `chunk_size` rows. If the model contains
+        `list[Model]` fields, the results must be ordered by the parent object,
+        see `Model.iter_results`.
+        """
+        parse = ResultParser(cls, prefix=prefix)
+        grouper = ResultGrouper(cls, check_sorted=check_sorted)
+        prepare = functools.partial(cls._prepare, presorted=True, check_sorted=check_sorted)
+        separator, pending = b"[", []
+        for result in results:
+            pending.extend(grouper.push(parse(result)))
+            if len(pending) >= chunk_size:
+                yield separator + cls._dump_json(prepare(pending), validate=validate)[1:-1]
+                separator, pending = b",", []
+
+        pending.extend(grouper.flush())
+        if pending:
+            yield separator + cls._dump_json(prepare(pending), validate=validate)[1:-1]
+            separator = b","
+        parse.report()
+        yield b"]" if separator == b"," else b"[]"
+
+    @classmethod
+    def _dump_json(cls, data: list[dict], *, validate: bool = True) -> bytes:
+        """Serialize prepared results to a JSON array, see `Model.results_to_json`."""
+        plan = None if validate else cls._json_plan()
+        if plan is None or not plan.serializable:
+            adapter = cls._list_adapter()
+            return adapter.dump_json(adapter.validate_python(data))
+
+        return pydantic_core.to_json(plan.apply(data))
+
+    @classmethod
+    def _json_plan(cls: type[typing.Self]) -> JsonPlan:
+        """Fetch (or compile and cache) the mapping of parsed results to serialized fields, see `JsonPlan`."""
+        plan = cls.__dict__.get("_cached_json_plan")
+        if plan is None:
+            plan = cls._compile_json_plan(set())
+            cls._cached_json_plan = plan
+
+        return plan
+
+    @classmethod
+    def _compile_json_plan(cls, seen: set[type[Model]]) -> JsonPlan:
+        """Compile the mapping of parsed results to serialized fields, see `JsonPlan`."""
+        # Prevent nested circular dependencies upon seeing an ancestor
+        seen.add(cls)
+        decorators = cls.__pydantic_decorators__
+        serializable = not (decorators.field_serializers or decorators.model_serializers or cls.model_computed_fields)
+        by_alias = cls.model_config.get("serialize_by_alias", False)
+        model_fields = cls._pdb_model_fields()
+        fields, children = [], []
+        for field, field_data in cls.model_fields.items():
+            if field_data.exclude:
+                continue
+            if getattr(field_data, "exclude_if", None) or getattr(
+                field_data,
+                "default_factory_takes_validated_data",
+                False,
+            ):
+                serializable = False
+
+            validation_alias = field_data.validation_alias if isinstance(field_data.validation_alias, str) else None
+            keys = tuple(dict.fromkeys(key for key in (validation_alias, field_data.alias, field) if key))
+            name = (field_data.serialization_alias or field) if by_alias else field
+            fields.append((keys, name, field_data))
+            if field in model_fields:
+                config = model_fields[field]
+                children.append((name, config.model, config.is_list))
+                if config.model not in seen:
+                    serializable = serializable and config.model._compile_json_plan(seen).serializable  # noqa: SLF001
+
+        return JsonPlan(tuple(fields), tuple(children), serializable)
+
+    @classmethod
+    async def afrom_results(
+        cls: type[typing.Self],
+        results: typing.Sequence[DictConvertible],
+        *,
+        prefix: str = "",
+        executor: concurrent.futures.Executor | None = None,
+        chunk_size: int = 1000,
+    ) -> list[typing.Self]:
+        """Convert a result set to a list of model instances, without blocking the event loop.
+
+        Async equivalent of `Model.from_results`. If an `executor` is provided
+        (thread or process pool) results are hydrated in the executor,
+        otherwise results are hydrated in the event loop thread, yielding to
+        other tasks after every `chunk_size` rows parsed or models built.
+
+        Results are sent to the executor as positional rows along with their
+        column names (as with `ParallelHydrator`), as driver records (i.e.
+        asyncpg) can't be pickled.
+        """
+        if executor is not None:
+            positional = _positional(results)
+            if positional is None:
+                hydrate = functools.partial(cls.from_results, list(map(_as_dict, results)), prefix=prefix)
+            else:
+                columns, rows = positional
+                hydrate = functools.partial(cls.from_rows, rows, columns, prefix=prefix)
+            return await asyncio.get_running_loop().run_in_executor(executor, hydrate)
+
+        parse = ResultParser(cls, prefix=prefix)
+        data = []
+        for start in range(0, len(results), chunk_size):
+            data.extend(map(parse, results[start : start + chunk_size]))
+            await asyncio.sleep(0)
+        parse.report()
+
+        start, rows_in = time.perf_counter(), len(data)
+        data = cls._prepare(data)
+        if _profilers:
+            profiling.record("flatten", cls, rows_in, len(data), time.perf_counter() - start)
+
+        build = cls._builder()
+        models, seconds = [], 0.0
+        for start in range(0, len(data), chunk_size):
+            started = time.perf_counter()
+            models.extend(build(data[start : start + chunk_size]))
+            seconds += time.perf_counter() - started
+            await asyncio.sleep(0)
+        if _profilers:
+            profiling.record("validate", cls, len(data), len(models), seconds)
+
+        return models
+
+    @classmethod
+    async def aone(
+        cls: type[typing.Self],
+        data: DictConvertible | list[DictConvertible],
+        *,
+        prefix: str = "",
+        executor: concurrent.futures.Executor | None = None,
+        chunk_size: int = 1000,
+    ) -> typing.Self:
+        """Async equivalent of `Model.one`, see `Model.afrom_results`.
+
+        A single result is hydrated in process, see `Model.from_result`.
+        """
+        if not isinstance(data, list):
+            return cls.from_result(data, prefix=prefix)
+
+        results = await cls.afrom_results(
+            data,
+            prefix=prefix,
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+        return results[0]
+
+    @classmethod
+    def from_cursor(
+        cls: type[typing.Self],
+        cursor: typing.Any,  # noqa: ANN401
+        *,
+        batch_size: int = 1000,
+        batches: bool = False,
+        prefix: str = "",
+        check_sorted: bool = False,
+    ) -> typing.Iterator[typing.Self | list[typing.Self]]:
+        """Convert the result set of an executed DB-API cursor to model instances.
+
+        Rows are fetched with `cursor.fetchmany(batch_size)` and each batch is
+        converted together, yielding individual models, or a list of models per
+        batch if `batches` is set. Both positional (tuple) rows and dict like
+        rows are supported.
+
+        If the model contains `list[Model]` fields, the results must be
+        ordered by the parent object, the rows of a parent that spans a batch
+        boundary are carried into the next batch, see `Model.iter_results` for
+        `check_sorted`.
+        """
+        for data in cls._fetch_batches(cursor, batch_size=batch_size, prefix=prefix, check_sorted=check_sorted):
+            models = cls._hydrate(data, presorted=True, check_sorted=check_sorted)
+            if not batches:
+                yield from models
+            elif models:
+                yield models
+
+    @classmethod
+    def _fetch_batches(
+        cls: type[typing.Self],
+        cursor: typing.Any,  # noqa: ANN401
+        *,
+        batch_size: int,
+        prefix: str = "",
+        check_sorted: bool = False,
+    ) -> typing.Iterator[list[dict]]:
+        """Fetch and parse batches of results, yielding the results of completed parents."""
+        grouper = ResultGrouper(cls, check_sorted=check_sorted)
+        parser = None
+        while rows := cursor.fetchmany(batch_size):
+            if parser is None:
+                positional = isinstance(rows[0], (tuple, list))
+                parser = ResultParser(cls, prefix=prefix, columns=cursor.description if positional else None)
+            yield grouper.push_many(parser.parse_all(rows))
+
+        yield grouper.flush()
+
+    @classmethod
+    def from_rows(
+        cls: type[typing.Self],
+        rows: typing.Iterable[typing.Sequence[typing.Any]],
+        columns: Columns,
+        *,
+        prefix: str = "",
+        workers: int | None = None,
+    ) -> list[typing.Self]:
+        """Convert a result set of positional rows (i.e. tuples) to a list of model instances.
+
+        `columns` provides the column names for each position in a row, either
+        as a list of names, or a DB-API `cursor.description`. The field layout
+        is resolved once for the result set, rather than converting each row
+        to a dict.
+
+        Very large result sets can be split across `workers` processes, see
+        `ParallelHydrator`.
+        """
+        if workers:
+            with ParallelHydrator(workers) as hydrator:
+                return hydrator.from_rows(cls, rows, columns, prefix=prefix)
+
+        data = ResultParser(cls, prefix=prefix, columns=columns).parse_all(rows)
+        return cls._hydrate(data)
+
+    @classmethod
+    def _hydrate(  # noqa: PLR0913
+        cls: type[typing.Self],
+        data: list[dict],
+        *,
+        lazy: bool = False,
+        as_records: bool = False,
+        identity_map: IdentityMap | None = None,
+        presorted: bool = False,
+        check_sorted: bool = False,
+        single: bool = False,
+    ) -> list[typing.Self]:
+        """Build Model instances from parsed results, flattening child list fields.
+
+        Results (including nested models) are validated in a single call to
+        pydantic-core, building repeated nested results once, see
+        `Model._build_memoized`. Lazy results are built as instances of the lazy
+        variant of the model, see `Model._lazy_model`, and records as
+        instances of the record class, see `Model._record_class`. Shared
+        instances are substituted from the `identity_map`, see
+        `Model._build_shared`. Results ordered by parent object can be
+        `presorted` (and `check_sorted`), see `_ResultTree`. A `single` result
+        is validated on its own, so errors are located relative to the model
+        rather than a list of results.
+        """
+        build = cls._builder(lazy=lazy, as_records=as_records, identity_map=identity_map, single=single)
+        prepare = functools.partial(cls._prepare, presorted=presorted, check_sorted=check_sorted)
+        if not _profilers:
+            return build(prepare(data))
+
+        start, rows_in = time.perf_counter(), len(data)
+        data = prepare(data)
+        flattened = time.perf_counter()
+        profiling.record("flatten", cls, rows_in, len(data), flattened - start)
+        models = build(data)
+        profiling.record("validate", cls, len(data), len(models), time.perf_counter() - flattened)
+        return models
+
+    @classmethod
+    def _builder(
+        cls: type[typing.Self],
+        *,
+        lazy: bool = False,
+        as_records: bool = False,
+        identity_map: IdentityMap | None = None,
+        single: bool = False,
+    ) -> typing.Callable[[list[dict]], list[typing.Self]]:
+        """Select the function building Model instances (or records) from prepared results, see `Model._hydrate`."""
+        if identity_map is not None and (lazy or as_records):
+            msg = "Lazy results and records can not be shared with an identity map."
+            raise ValueError(msg)
+
+        model = cls._lazy_model() if lazy else cls
+        build = functools.partial(cls._build_records if as_records else model._validate, single=single)  # noqa: SLF001
+        if not (lazy or as_records) and cls._sharing()[1]:
+            build = functools.partial(cls._build_memoized, build=build)
+        if identity_map is not None:
+            build = functools.partial(cls._build_shared, build=build, identity_map=identity_map)
+        return build
+
+    @classmethod
+    def _validate(cls: type[typing.Self], data: list[dict], *, single: bool = False) -> list[typing.Self]:
+        """Build Model instances from prepared results, validating a `single` result on its own."""
+        if single:
+            return [cls.__pydantic_validator__.validate_python(data[0])]
+        return cls._list_adapter().validate_python(data)
+
+    @classmethod
+    def _build_memoized(
+        cls: type[typing.Self],
+        data: list[dict],
+        *,
+        build: typing.Callable[[list[dict]], list[typing.Self]],
+    ) -> list[typing.Self]:
+        """Build Model instances from prepared results, building repeated nested results once, see `Model._build_children`.
+
+        If a nested result fails validation, the results are validated as a
+        whole so errors are located relative to the top level results.
+        """
+        with contextlib.suppress(pydantic.ValidationError):
+            # Shared instances (see `Model._share`) are already built.
+            cls._build_children([row for row in data if isinstance(row, dict)])
+
+        return build(data)
+
+    @classmethod
+    def _build_children(cls, data: list[dict]) -> None:
+        """Replace repeated nested results of prepared results with a single built instance, at every level of nesting.
+
+        Nested results of each field are deduplicated (see `_repeated`), and
+        if any are repeated the distinct results are built in a single batch,
+        and the instance shared by every parent. Only immutable models are
+        shared, see `Model._sharing`. Fields without repeated results are left
+        to be built with their parents.
+        """
+        for model_prefix, config in cls._pdb_model_fields().items():
+            if config.is_list:
+                values = [
+                    v
+                    for row in data
+                    if isinstance(value := row.get(model_prefix), list)
+                    for v in value
+                    if isinstance(v, dict)
+                ]
+            else:
+                values = [value for row in data if isinstance(value := row.get(model_prefix), dict)]
+
+            model = config.model
+            shared = _repeated(values, model._key_getters().data) if model._sharing()[0] else None  # noqa: SLF001
+            if not shared:
+                model._build_children(values)  # noqa: SLF001
+                continue
+
+            distinct = [value for value in values if id(value) not in shared]
+            model._build_children(distinct)  # noqa: SLF001
+
+            built = dict(zip(map(id, distinct), model._validate(distinct), strict=True))  # noqa: SLF001
+            built.update((id_, built[id(value)]) for id_, value in shared.items())
+            for row in data:
+                value = row.get(model_prefix)
+                if config.is_list and isinstance(value, list):
+                    row[model_prefix] = [built.get(id(v), v) for v in value]
+                elif isinstance(value, dict):
+                    row[model_prefix] = built[id(value)]
+
+    @classmethod
+    def _sharing(cls) -> tuple[bool, bool]:
+        """Fetch (or compute and cache) whether built instances can be shared, see `Model._build_children`.
+
+        Returns whether instances of the model can be shared by several
+        parents (the model and all nested models are frozen, so sharing can
+        not be observed by mutating a parent), and whether any nested model
+        can be.
+        """
+        sharing = cls.__dict__.get("_cached_sharing")
+        if sharing is None:
+            sharing = cls._compile_sharing(frozenset())
+            cls._cached_sharing = sharing
+
+        return sharing
+
+    @classmethod
+    def _compile_sharing(cls, ancestors: frozenset[type[Model]]) -> tuple[bool, bool]:
+        """Compute whether built instances can be shared, see `Model._sharing`."""
+        ancestors |= {cls}
+        shareable, children = bool(cls.model_config.get("frozen")), False
+        for config in cls._pdb_model_fields().values():
+            if config.model in ancestors:
+                # Circular reference, the ancestor's nested models are already being checked.
+                child = (bool(config.model.model_config.get("frozen")), False)
+            else:
+                child = config.model._compile_sharing(ancestors)  # noqa: SLF001
+            shareable = shareable and child[0]
+            children = children or any(child)
+
+        return shareable, children
+
+    @classmethod
+    def _build_shared(
+        cls: type[typing.Self],
+        data: list[dict],
+        *,
+        build: typing.Callable[[list[dict]], list[typing.Self]],
+        identity_map: IdentityMap,
+    ) -> list[typing.Self]:
+        """Build Model instances from prepared results, sharing instances with an identity map.
+
+        Cached instances are substituted for (nested) results before they are
+        built, and newly built instances are added to the map.
+        """
+        misses: dict[int, tuple[tuple | None, dict]] = {}
+        data = [cls._share(row, identity_map, misses) for row in data]
+        models = build(data)
+        for row, model in zip(data, models, strict=True):
+            cls._share_hydrated(row, model, identity_map, misses)
+
+        return models
+
+    @classmethod
+    def _share(cls, data: dict, identity_map: IdentityMap, misses: dict[int, tuple[tuple | None, dict]]) -> typing.Any:  # noqa: ANN401
+        """Substitute the cached instance for a prepared result, if the result is equal.
+
+        Nested results are substituted first, so results with shared children
+        compare equal. Results not found are recorded in `misses` (by id) with
+        their key and a copy of the result, as building a model may alter it.
+        """
+        for model_prefix, config in cls._pdb_model_fields().items():
+            value = data.get(model_prefix)
+            if value and config.is_list and isinstance(value, list):
+                data[model_prefix] = [
+                    config.model._share(v, identity_map, misses) if isinstance(v, dict) else v  # noqa: SLF001
+                    for v in value
+                ]
+            elif isinstance(value, dict):
+                data[model_prefix] = config.model._share(value, identity_map, misses)  # noqa: SLF001
+
+        try:
+            key = cls._dict_key(data)
+            instance = identity_map.get(cls, key, data)
+        except (KeyError, TypeError):
+            # Results without (hashable) identity fields can not be shared.
+            key = instance = None
+
+        if instance is None:
+            misses[id(data)] = (key, dict(data))
+            return data
+
+        return instance
+
+    @classmethod
+    def _share_hydrated(
+        cls,
+        data: typing.Any,  # noqa: ANN401
+        model: Model,
+        identity_map: IdentityMap,
+        misses: dict[int, tuple[tuple | None, dict]],
+    ) -> None:
+        """Add a built instance (and nested instances) missing from the identity map."""
+        miss = misses.get(id(data))
+        if miss is None:
+            return
+
+        key, data = miss
+        model_fields = cls._pdb_model_fields()
+        for model_prefix, config in model_fields.items():
+            value, instance = data.get(model_prefix), getattr(model, model_prefix, None)
+            if not value or instance is None:
+                continue
+            if config.is_list:
+                if isinstance(value, list):
+                    for v, i in zip(value, instance, strict=False):
+                        config.model._share_hydrated(v, i, identity_map, misses)  # noqa: SLF001
+            else:
+                config.model._share_hydrated(value, instance, identity_map, misses)  # noqa: SLF001
+
+        if key is not None:
+            shared = {
+                model_prefix: getattr(model, model_prefix) for model_prefix in model_fields if model_prefix in data
+            }
+            identity_map.put(cls, key, data | shared, model)
+
+    @classmethod
+    def _build_records(cls, data: list[dict], *, single: bool = False) -> list[typing.Any]:
+        """Build records from prepared results, validating a `single` result on its own."""
+        if single:
+            return [cls._record_class().__pydantic_validator__.validate_python(data[0])]
+        adapter = cls.__dict__.get("_cached_record_adapter")
+        if adapter is None:
+            adapter = pydantic.TypeAdapter(list[cls._record_class()])  # ty: ignore[invalid-type-form]
+            cls._cached_record_adapter = adapter
+        return adapter.validate_python(data)
+
+    @classmethod
+    def _record_class(cls) -> type:
+        """Fetch (or build and cache) the record class of the model."""
+        record = cls.__dict__.get("_cached_record_class")
+        if record is None:
+            record, _ = cls._compile_record_class(set())
+
+        return record
+
+    @classmethod
+    def _compile_record_class(cls, building: set[type[Model]]) -> tuple[type, set[type[Model]]]:
+        """Build a read only record class mirroring the model fields, and nested models.
+
+        Records are frozen (pydantic) dataclasses with `__slots__`, hashed by
+        the model `_hash_fields`, and compared excluding the model
+        `_eq_excluded_fields`.
+
+        Returns the record class, and the models of circular references left
+        as parsed results. Record classes built with a circular reference to
+        a model being built above them are not cached, they differ from the
+        record class built when the model is requested directly.
+        """
+        ancestors = frozenset(building)
+        building.add(cls)
+        guarded: set[type[Model]] = set()
+        model_fields = cls._pdb_model_fields()
+        annotations, namespace = {}, {}
+        for field, field_data in cls.model_fields.items():
+            annotation = field_data.annotation
+            config = model_fields.get(field)
+            if config is not None:
+                child = config.model
+                annotation = child.__dict__.get("_cached_record_class")
+                if annotation is None and child in building:
+                    # Guard against recursing through circular references, which are left as parsed results.
+                    annotation = typing.Any
+                    guarded.add(child)
+                elif annotation is None:
+                    annotation, child_guarded = child._compile_record_class(building)  # noqa: SLF001
+                    guarded |= child_guarded
+                if config.is_list:
+                    annotation = list[annotation]  # ty: ignore[invalid-type-form]
+                if config.optional:
+                    annotation = annotation | None
+
+            annotations[field] = annotation
+            namespace[field] = copy.copy(field_data)
+
+        key = cls._key_getters().instance
+        eq_fields = tuple(field for field in annotations if field not in cls._eq_excluded_fields)
+
+        def __eq__(self: object, other: object) -> bool:  # noqa: N807
+            return type(self) is type(other) and all(getattr(self, f) == getattr(other, f) for f in eq_fields)
+
+        def __hash__(self: object) -> int:  # noqa: N807
+            return hash(key(self))
+
+        namespace.update(
+            __module__=cls.__module__,
+            __qualname__=f"{cls.__qualname__}Record",
+            __doc__=cls.__doc__,
+            __annotations__=annotations,
+            __eq__=__eq__,
+            __hash__=__hash__,
+        )
+        record = types.new_class(f"{cls.__name__}Record", exec_body=lambda ns: ns.update(namespace))
+        config = pydantic.ConfigDict(**{k: v for k, v in cls.model_config.items() if k != "frozen"})
+        record = pydantic.dataclasses.dataclass(frozen=True, slots=True, eq=False, kw_only=True, config=config)(record)
+        building.discard(cls)
+        if not guarded & ancestors:
+            cls._cached_record_class = record
+        return record, guarded
+
+    @classmethod
+    def _lazy_model(cls: type[typing.Self]) -> type[typing.Self]:
+        """Fetch (or build and cache) the lazy variant of the model.
+
+        The lazy variant is a subclass of the model (named `<Model>Lazy`),
+        with nested model fields accepting any (parsed result) value, see
+        `LazyModel`. Models without nested model fields are their own lazy
+        variant.
+        """
+        lazy = cls.__dict__.get("_cached_lazy_model")
+        if lazy is None:
+            model_fields = cls._pdb_model_fields()
+            if not model_fields:
+                lazy = cls
+            else:
+                namespace = {
+                    "__module__": cls.__module__,
+                    "__qualname__": f"{cls.__qualname__}Lazy",
+                    "__doc__": cls.__doc__,
+                    "__annotations__": dict.fromkeys(model_fields, typing.Any),
+                    "_lazy_origin": cls,
+                    **{field: copy.copy(cls.model_fields[field]) for field in model_fields},
+                }
+                lazy = types.new_class(
+                    f"{cls.__name__}Lazy",
+                    (cls, LazyModel),
+                    exec_body=lambda ns: ns.update(namespace),
+                )
+            cls._cached_lazy_model = lazy
+
+        return lazy
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear cached result plans, columns, adapters etc. for the model and any subclasses.
+
+        Caches for a model include details of nested models, to clear every
+        cache (i.e. after a nested model is rebuilt) use `Model.clear_cache()`.
+        """
+        for name in [name for name in vars(cls) if name.startswith("_cached_")]:
+            setattr(cls, name, None)
+        for subclass in cls.__subclasses__():
+            subclass.clear_cache()
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: typing.Any = None,  # noqa: ANN401
+    ) -> bool | None:
+        """Rebuild the model schema, clearing all cached model details, see `Model.clear_cache`."""
+        rebuilt = super().model_rebuild(
+            force=force,
+            raise_errors=raise_errors,
+            _parent_namespace_depth=_parent_namespace_depth + 1,
+            _types_namespace=_types_namespace,
+        )
+        Model.clear_cache()
+        return rebuilt
+
+    @classmethod
+    def as_columns(cls, base_table: str | None = None) -> list[tuple[str, ...]]:
         """Extract nested field name tuples."""
-        return list(cls.as_typed_columns(base_table=base_table).keys())
+        cache = cls.__dict__.get("_cached_columns")
+        if cache is None:
+            cache = {}
+            cls._cached_columns = cache
+
+        columns = cache.get(base_table)
+        if columns is None:
+            columns = cache[base_table] = tuple(cls.as_typed_columns(base_table=base_table))
+
+        return list(columns)
+
+    @classmethod
+    def to_rows(
+        cls,
+        models: typing.Iterable[Model],
+        columns: typing.Sequence[str] | None = None,
+        *,
+        chunk_size: int | None = None,
+    ) -> typing.Iterator[tuple] | typing.Iterator[list[tuple]]:
+        """Flatten model instances to positional rows, i.e. parameters for `executemany`.
+
+        `columns` are `__` separated (nested) field names, as returned in
+        results, i.e. `owner__id`. By default all columns from
+        `Model.as_columns` are included, except for columns of `list[Model]`
+        fields which can not be flattened to a single row. Missing optional
+        nested models produce `None` for each of their columns.
+
+        Rows are generated lazily, or as lists of up to `chunk_size` rows. A
+        ValueError is raised if there are no columns to include.
+        """
+        row = cls._row_getter(tuple(columns) if columns is not None else None)
+        rows = map(row, models)
+        if chunk_size is None:
+            return rows
+
+        return iter(lambda: list(itertools.islice(rows, chunk_size)), [])
+
+    @classmethod
+    def _row_getter(cls, columns: tuple[str, ...] | None) -> typing.Callable[[Model], tuple]:
+        """Fetch (or compile and cache) a function flattening a model to a row of `columns`, see `Model.to_rows`."""
+        getters = cls.__dict__.get("_cached_row_getters")
+        if getters is None:
+            getters = {}
+            cls._cached_row_getters = getters
+
+        getter = getters.get(columns)
+        if getter is None:
+            if columns is None:
+                paths = [path for column in cls.as_columns() if (path := cls._attribute_path(column))]
+            else:
+                paths = []
+                for column in columns:
+                    path = cls._attribute_path(column.split("__"))
+                    if path is None:
+                        msg = f"Column {column!r} of {cls.__name__} is part of a list field."
+                        raise ValueError(msg)
+                    paths.append(path)
+
+            if not paths:
+                msg = f"No columns to flatten {cls.__name__} to."
+                raise ValueError(msg)
+            if all(len(path) == 1 for path in paths):
+                attributes = operator.attrgetter(*(path[0] for path in paths))
+                getter = attributes if len(paths) > 1 else lambda model: (attributes(model),)
+            else:
+                path_getters = [_path_getter(path) for path in paths]
+                getter = lambda model: tuple([get(model) for get in path_getters])  # noqa: E731
+
+            getters[columns] = getter
+
+        return getter
+
+    @classmethod
+    def _attribute_path(cls, column: typing.Sequence[str]) -> tuple[str, ...] | None:
+        """Resolve a (nested) column name to attribute names, or None if it is part of a list field."""
+        name, *child = column
+        fields = {field_data.alias or field: field for field, field_data in cls.model_fields.items()}
+        field = fields.get(name, name)
+        if field not in cls.model_fields:
+            msg = f"Unknown column {'__'.join(column)!r} for {cls.__name__}."
+            raise ValueError(msg)
+        if not child:
+            return (field,)
+
+        config = cls._pdb_model_fields().get(field)
+        if config is None:
+            msg = f"Unknown column {'__'.join(column)!r} for {cls.__name__}."
+            raise ValueError(msg)
+        if config.is_list:
+            return None
+
+        path = config.model._attribute_path(child)  # noqa: SLF001
+        return None if path is None else (field, *path)
+
+    @classmethod
+    def select_columns(cls, table_aliases: typing.Mapping[str, str] | None = None) -> str:
+        """Render the aliased column expressions to select the model fields, i.e. `u.id AS owner__id`.
+
+        `table_aliases` maps `__` separated (nested) field names to a table
+        alias, use `""` for the model table. Every nested field requires an
+        alias, without any aliases the unqualified column names are rendered.
+        The rendered SQL is cached for each set of aliases, see
+        `Model.clear_cache`.
+        """
+        table_aliases = table_aliases or {}
+        cache = cls.__dict__.get("_cached_select_columns")
+        if cache is None:
+            cache = {}
+            cls._cached_select_columns = cache
+
+        key = tuple(sorted(table_aliases.items()))
+        sql = cache.get(key)
+        if sql is None:
+            expressions = []
+            for column in cls.as_columns():
+                name, field = "__".join(column), "__".join(column[:-1])
+                alias = table_aliases.get(field)
+                if alias:
+                    expression = f"{alias}.{column[-1]}"
+                elif field and table_aliases:
+                    msg = f"No table alias for nested field {field!r} of {cls.__name__}."
+                    raise ValueError(msg)
+                else:
+                    expression = name
+
+                expressions.append(expression if expression.rpartition(".")[2] == name else f"{expression} AS {name}")
+
+            sql = cache[key] = ", ".join(expressions)
+
+        return sql
 
     @classmethod
     def as_typed_columns(
@@ -266,9 +2127,33 @@ class Model(pydantic.BaseModel):
         base_table: str | None = None,
         seen: set[type[Model]] | None = None,
     ) -> dict[tuple[str, ...], type[typing.Any] | None]:
-        """Extract nested field name tuples and the associated field type annotation."""
+        """Extract nested field name tuples and the associated field type annotation.
+
+        Columns are computed once for each `base_table` and cached, see
+        `Model.clear_cache`.
+        """
+        if seen:
+            return cls._compile_typed_columns(base_table, seen)
+
+        cache = cls.__dict__.get("_cached_typed_columns")
+        if cache is None:
+            cache = {}
+            cls._cached_typed_columns = cache
+
+        columns = cache.get(base_table)
+        if columns is None:
+            columns = cache[base_table] = cls._compile_typed_columns(base_table, set())
+
+        return dict(columns)
+
+    @classmethod
+    def _compile_typed_columns(
+        cls,
+        base_table: str | None,
+        seen: set[type[Model]],
+    ) -> dict[tuple[str, ...], type[typing.Any] | None]:
+        """Extract nested field name tuples and annotations, see `Model.as_typed_columns`."""
         # Prevent nested circular dependencies upon seeing an ancestor
-        seen = seen or set()
         seen.add(cls)
         columns: dict[tuple[str, ...], type[typing.Any] | None] = {}
         model_fields = cls._pdb_model_fields()
@@ -297,10 +2182,40 @@ class Model(pydantic.BaseModel):
         provided sorting against available query fields.
 
         To exclude fields override the class var `_skip_sortable_fields`.
+
+        Fields are computed once and cached, see `Model.clear_cache`. For
+        membership checks use `Model.sortable_field_set`.
         """
+        if seen:
+            return cls._compile_sortable_fields(seen, recurse=recurse)
+
+        return list(cls._sortable_fields_cache(recurse=recurse)[0])
+
+    @classmethod
+    def sortable_field_set(cls, *, recurse: bool = True) -> frozenset[str]:
+        """Fetch the sortable fields of a model as a set, see `Model.sortable_fields`."""
+        return cls._sortable_fields_cache(recurse=recurse)[1]
+
+    @classmethod
+    def _sortable_fields_cache(cls, *, recurse: bool) -> tuple[tuple[str, ...], frozenset[str]]:
+        """Fetch (or compute and cache) the sorted sortable fields, and a set of them."""
+        cache = cls.__dict__.get("_cached_sortable_fields")
+        if cache is None:
+            cache = {}
+            cls._cached_sortable_fields = cache
+
+        fields = cache.get(recurse)
+        if fields is None:
+            sorted_fields = tuple(cls._compile_sortable_fields(set(), recurse=recurse))
+            fields = cache[recurse] = (sorted_fields, frozenset(sorted_fields))
+
+        return fields
+
+    @classmethod
+    def _compile_sortable_fields(cls, seen: set[type[Model]], *, recurse: bool) -> list[str]:
+        """Extract sortable fields, see `Model.sortable_fields`."""
         # Prevent nested circular dependencies upon seeing an ancestor
         fields = set()
-        seen = seen or set()
         seen.add(cls)
         model_fields = cls._pdb_model_fields()
         skipped_fields = cls._skip_sortable_fields or set()
@@ -324,3 +2239,85 @@ class Model(pydantic.BaseModel):
                     fields.add(sortable_field)
 
         return sorted(fields)
+
+
+# Instance `__dict__` key for the parsed results of unhydrated lazy fields.
+_LAZY_FIELDS = "_pdb_lazy"
+
+
+class _Pending:
+    """Placeholder for unhydrated lazy fields in reprs."""
+
+    def __repr__(self) -> str:
+        return "<pending>"
+
+
+_PENDING = _Pending()
+
+
+class LazyModel(Model):
+    """Base class of lazy model variants, see `Model.from_results`.
+
+    Nested model fields of lazy instances hold their parsed results, and are
+    only hydrated (as lazy instances) on first access or serialization.
+    """
+
+    def __getattr__(self, name: str) -> typing.Any:  # noqa: ANN401
+        """Hydrate a lazy field on first access."""
+        lazy = self.__dict__.get(_LAZY_FIELDS)
+        if lazy is not None and name in lazy:
+            return self._hydrate_field(name)
+        return super().__getattr__(name)
+
+    def _hydrate_field(self, name: str) -> typing.Any:  # noqa: ANN401
+        """Hydrate the parsed results of a lazy field."""
+        config = self._lazy_origin._pdb_model_fields()[name]  # noqa: SLF001
+        value = self.__dict__[_LAZY_FIELDS][name]
+        if value:
+            model = config.model._lazy_model()  # noqa: SLF001
+            models = model._validate(value if config.is_list else [value], single=not config.is_list)  # noqa: SLF001
+            value = models if config.is_list else models[0]
+
+        self.__dict__[name] = value
+        return value
+
+    def _hydrate_pending(self) -> None:
+        """Hydrate any lazy fields not yet accessed."""
+        lazy = self.__dict__.get(_LAZY_FIELDS)
+        if lazy is not None:
+            for name in lazy:
+                if name not in self.__dict__:
+                    self._hydrate_field(name)
+
+    @pydantic.model_serializer(mode="wrap")
+    def _serialize_lazy(self, handler: pydantic.SerializerFunctionWrapHandler) -> typing.Any:  # noqa: ANN401
+        """Hydrate any lazy fields before serialization."""
+        self._hydrate_pending()
+        return handler(self)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Pickle lazy instances as instances of the model they are a lazy variant of, hydrating any lazy fields.
+
+        Lazy variants are built at runtime, so can not be imported when unpickling.
+        """
+        self._hydrate_pending()
+        state = self.__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k != _LAZY_FIELDS}
+        return object.__new__, (self._lazy_origin,), state
+
+    def __repr_args__(self) -> typing.Iterator[tuple[str | None, typing.Any]]:
+        """Include unhydrated lazy fields in reprs, without hydrating them."""
+        yield from super().__repr_args__()
+        lazy = self.__dict__.get(_LAZY_FIELDS, {})
+        for name in lazy:
+            if name not in self.__dict__:
+                yield name, _PENDING
+
+    @classmethod
+    def _validate(cls: type[typing.Self], data: list[dict], *, single: bool = False) -> list[typing.Self]:
+        """Build lazy instances from prepared results, setting aside the parsed results of nested model fields."""
+        models = super()._validate(data, single=single)
+        model_fields = cls._lazy_origin._pdb_model_fields()  # noqa: SLF001
+        for model in models:
+            model.__dict__[_LAZY_FIELDS] = {field: model.__dict__.pop(field) for field in model_fields}
+        return models
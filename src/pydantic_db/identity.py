@@ -0,0 +1,100 @@
+"""Identity map, sharing model instances for equal results across calls.
+
+Results for the same model and `_hash_fields` key are often hydrated over and
+over (i.e. the owner of many records, or lookup rows). An `IdentityMap`
+passed to `Model.from_results` caches hydrated instances, and substitutes the
+cached instance (skipping validation) whenever the result data is equal to
+the data it was hydrated from. Instances are only cached once validated, so
+a substituted instance is always a validated one.
+
+Cached instances are shared, so should not be mutated, consider using frozen
+models.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from pydantic_db import Model
+
+
+class IdentityMapStats(typing.NamedTuple):
+    """Cache statistics of an identity map."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class _Entry(typing.NamedTuple):
+    data: dict
+    instance: Model
+    expires: float
+
+
+class IdentityMap:
+    """Least recently used cache of model instances, keyed by model class and `_hash_fields` key.
+
+    Holds at most `maxsize` instances, and optionally expires instances `ttl`
+    seconds after they were cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float | None = None,
+        *,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = self.misses = self.evictions = 0
+        self._entries: collections.OrderedDict[tuple[type[Model], tuple], _Entry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model: type[Model], key: tuple, data: dict) -> Model | None:
+        """Fetch the cached instance of a model, if it was hydrated from equal data."""
+        with self._lock:
+            entry = self._entries.get((model, key))
+            if entry is None or entry.data != data:
+                self.misses += 1
+                return None
+
+            if self.ttl is not None and entry.expires <= self.clock():
+                del self._entries[model, key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((model, key))
+            self.hits += 1
+            return entry.instance
+
+    def put(self, model: type[Model], key: tuple, data: dict, instance: Model) -> None:
+        """Cache an instance of a model, along with the data it was hydrated from."""
+        expires = 0.0 if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[model, key] = _Entry(data, instance, expires)
+            self._entries.move_to_end((model, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached instances, and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> IdentityMapStats:
+        """Fetch the cache statistics."""
+        return IdentityMapStats(self.hits, self.misses, self.evictions, len(self._entries))
@@ -0,0 +1,263 @@
+"""Encode model instances for PostgreSQL `COPY ... FROM STDIN`.
+
+Models are flattened to rows (see `Model.to_rows`), and each column encoded
+in the COPY text or binary format by PostgreSQL type. Types are inferred from
+the field annotations (see `Model.as_typed_columns`), and can be overridden
+per column.
+
+    encoder = CopyEncoder(User)
+    with cursor.copy(f"COPY my_user ({', '.join(encoder.columns)}) FROM STDIN (FORMAT BINARY)") as copy:
+        for chunk in encoder.binary(users):
+            copy.write(chunk)
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import enum
+import math
+import struct
+import types
+import typing
+import uuid
+
+import pydantic_core
+
+if typing.TYPE_CHECKING:
+    from pydantic_db import Model
+
+BINARY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+# Signature, flags and header extension length.
+BINARY_HEADER = BINARY_SIGNATURE + struct.pack("!ii", 0, 0)
+BINARY_TRAILER = struct.pack("!h", -1)
+
+_POSTGRES_EPOCH = dt.datetime(2000, 1, 1)  # noqa: DTZ001
+_POSTGRES_EPOCH_TZ = _POSTGRES_EPOCH.replace(tzinfo=dt.timezone.utc)
+_POSTGRES_EPOCH_DATE = _POSTGRES_EPOCH.date()
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+# Python types (checked in order) and the PostgreSQL type they are encoded as by default.
+DEFAULT_TYPES: tuple[tuple[type, str], ...] = (
+    (bool, "bool"),
+    (int, "int8"),
+    (float, "float8"),
+    (decimal.Decimal, "numeric"),
+    (str, "text"),
+    (bytes, "bytea"),
+    (dt.datetime, "timestamptz"),
+    (dt.date, "date"),
+    (dt.time, "time"),
+    (dt.timedelta, "interval"),
+    (uuid.UUID, "uuid"),
+)
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _text_float(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return repr(value)
+
+
+def _text_interval(value: dt.timedelta) -> str:
+    return f"{value.days} days {value.seconds} seconds {value.microseconds} microseconds"
+
+
+def _binary_numeric(value: decimal.Decimal) -> bytes:
+    """Encode a decimal as PostgreSQL numeric, a sign, weight and scale with base 10000 digits."""
+    if value.is_nan():
+        return struct.pack("!hhHH", 0, 0, 0xC000, 0)
+    if value.is_infinite():
+        return struct.pack("!hhHH", 0, 0, 0xF000 if value.is_signed() else 0xD000, 0)
+
+    sign, digits, exponent = value.as_tuple()
+    exponent = typing.cast("int", exponent)
+    scale = max(0, -exponent)
+    number = "".join(map(str, digits)) + "0" * max(0, exponent)
+    integer, fraction = number[: len(number) - scale], number[len(number) - scale :]
+    integer = integer.lstrip("0")
+    fraction = fraction.rjust(scale, "0")
+
+    # Group digits into base 10000 digits, either side of the decimal point.
+    integer = integer.rjust(-(-len(integer) // 4) * 4, "0")
+    fraction = fraction.ljust(-(-len(fraction) // 4) * 4, "0")
+    groups = [int(integer[i : i + 4]) for i in range(0, len(integer), 4)]
+    weight = len(groups) - 1
+    groups.extend(int(fraction[i : i + 4]) for i in range(0, len(fraction), 4))
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+
+    header = struct.pack("!hhHH", len(groups), weight, 0x4000 if sign else 0, scale)
+    return header + struct.pack(f"!{len(groups)}H", *groups)
+
+
+def _timestamp(value: dt.datetime) -> dt.datetime:
+    """Normalise a `timestamp` value, aware datetimes are converted to UTC wall time."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+
+
+def _timestamptz(value: dt.datetime) -> dt.datetime:
+    """Normalise a `timestamptz` value, naive datetimes are assumed to be UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value
+
+
+def _binary_timestamp(value: dt.datetime) -> bytes:
+    return struct.pack("!q", (_timestamp(value) - _POSTGRES_EPOCH) // _MICROSECOND)
+
+
+def _binary_timestamptz(value: dt.datetime) -> bytes:
+    return struct.pack("!q", (_timestamptz(value) - _POSTGRES_EPOCH_TZ) // _MICROSECOND)
+
+
+def _binary_time(value: dt.time) -> bytes:
+    microseconds = ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+    return struct.pack("!q", microseconds)
+
+
+def _binary_interval(value: dt.timedelta) -> bytes:
+    return struct.pack("!qii", value.seconds * 1_000_000 + value.microseconds, value.days, 0)
+
+
+class Codec(typing.NamedTuple):
+    """Text and binary COPY encoders of a PostgreSQL type."""
+
+    text: typing.Callable[[typing.Any], str]
+    binary: typing.Callable[[typing.Any], bytes]
+
+
+CODECS: dict[str, Codec] = {
+    "bool": Codec(lambda v: "t" if v else "f", lambda v: b"\x01" if v else b"\x00"),
+    "int2": Codec(str, struct.Struct("!h").pack),
+    "int4": Codec(str, struct.Struct("!i").pack),
+    "int8": Codec(str, struct.Struct("!q").pack),
+    "float4": Codec(_text_float, struct.Struct("!f").pack),
+    "float8": Codec(_text_float, struct.Struct("!d").pack),
+    "numeric": Codec(str, _binary_numeric),
+    "text": Codec(str, lambda v: str(v).encode()),
+    "varchar": Codec(str, lambda v: str(v).encode()),
+    "bytea": Codec(lambda v: "\\x" + v.hex(), bytes),
+    "date": Codec(dt.date.isoformat, lambda v: struct.pack("!i", (v - _POSTGRES_EPOCH_DATE).days)),
+    "time": Codec(dt.time.isoformat, _binary_time),
+    # Both formats load the same instant, text values are normalised as binary values are.
+    "timestamp": Codec(lambda v: _timestamp(v).isoformat(), _binary_timestamp),
+    "timestamptz": Codec(lambda v: _timestamptz(v).isoformat(), _binary_timestamptz),
+    "interval": Codec(_text_interval, _binary_interval),
+    "uuid": Codec(str, lambda v: v.bytes),
+    "json": Codec(lambda v: pydantic_core.to_json(v).decode(), pydantic_core.to_json),
+    "jsonb": Codec(lambda v: pydantic_core.to_json(v).decode(), lambda v: b"\x01" + pydantic_core.to_json(v)),
+}
+
+
+def _field_type(annotation: typing.Any) -> typing.Any:  # noqa: ANN401
+    """Extract the type of optional field annotations."""
+    if type(annotation) is types.UnionType or typing.get_origin(annotation) is typing.Union:
+        return next((arg for arg in typing.get_args(annotation) if arg is not type(None)), annotation)
+    return annotation
+
+
+def postgres_type(annotation: typing.Any) -> str:  # noqa: ANN401
+    """Infer the PostgreSQL type of a field annotation, defaulting to `jsonb` for other types."""
+    annotation = _field_type(annotation)
+    if isinstance(annotation, type):
+        for type_, name in DEFAULT_TYPES:
+            if issubclass(annotation, type_):
+                return name
+
+    return "jsonb"
+
+
+def _by_value(encode: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable[[typing.Any], typing.Any]:
+    """Encode enum members by value."""
+    return lambda member: encode(member.value)
+
+
+class CopyEncoder:
+    """Encode model instances in the PostgreSQL COPY text or binary format.
+
+    `columns` are `__` separated (nested) field names, defaulting to the
+    columns of `Model.to_rows`. The PostgreSQL type of each column is
+    inferred from the field annotation, provide `types` to override the type
+    of a column (i.e. `{"id": "int4"}`), binary COPY requires the exact
+    column type.
+
+    Encoded chunks contain up to `chunk_size` rows.
+    """
+
+    def __init__(
+        self,
+        model: type[Model],
+        columns: typing.Sequence[str] | None = None,
+        *,
+        types: typing.Mapping[str, str] | None = None,
+    ) -> None:
+        annotations = {"__".join(column): annotation for column, annotation in model.as_typed_columns().items()}
+        if columns is None:
+            columns = [
+                "__".join(column)
+                for column in model.as_columns()
+                if model._attribute_path(column) is not None  # noqa: SLF001
+            ]
+        self.model = model
+        self.columns = tuple(columns)
+        self.types = {column: postgres_type(annotations.get(column)) for column in self.columns} | dict(types or {})
+        unknown = {type_ for type_ in self.types.values() if type_ not in CODECS}
+        if unknown:
+            msg = f"Unsupported PostgreSQL types {sorted(unknown)}."
+            raise ValueError(msg)
+
+        self._text, self._binary = [], []
+        for column in self.columns:
+            codec = CODECS[self.types[column]]
+            field_type = _field_type(annotations.get(column))
+            if isinstance(field_type, type) and issubclass(field_type, enum.Enum):
+                codec = Codec(_by_value(codec.text), _by_value(codec.binary))
+            self._text.append(codec.text)
+            self._binary.append(codec.binary)
+        self._field_count = struct.pack("!h", len(self.columns))
+
+    def text(self, models: typing.Iterable[Model], *, chunk_size: int = 1000) -> typing.Iterator[bytes]:
+        """Encode models as COPY text format chunks, `\\N` is used for NULL values."""
+        encoders = self._text
+        for rows in self.model.to_rows(models, self.columns, chunk_size=chunk_size):
+            lines = []
+            for row in rows:
+                fields = [
+                    "\\N" if value is None else encode(value).translate(_TEXT_ESCAPES)
+                    for encode, value in zip(encoders, row, strict=True)
+                ]
+                lines.append("\t".join(fields))
+            lines.append("")
+            yield "\n".join(lines).encode()
+
+    def binary(self, models: typing.Iterable[Model], *, chunk_size: int = 1000) -> typing.Iterator[bytes]:
+        """Encode models as COPY binary format chunks, including the header and trailer."""
+        encoders = self._binary
+        pack_length = struct.Struct("!i").pack
+        null = pack_length(-1)
+        header = BINARY_HEADER
+        for rows in self.model.to_rows(models, self.columns, chunk_size=chunk_size):
+            buffer, header = [header], b""
+            for row in rows:
+                buffer.append(self._field_count)
+                for encode, value in zip(encoders, row, strict=True):
+                    if value is None:
+                        buffer.append(null)
+                    else:
+                        data = encode(value)
+                        buffer.extend((pack_length(len(data)), data))
+            yield b"".join(buffer)
+
+        yield header + BINARY_TRAILER
@@ -0,0 +1,82 @@
+"""Per stage timing hooks for result hydration.
+
+Register a callback to receive a `StageTiming` for each stage of converting
+results into models:
+
+- `parse`: routing database results into (nested) dicts.
+- `flatten`: flattening `list[Model]` fields, at every level of nesting.
+- `validate`: validating prepared results into models.
+
+When no callbacks are registered, hydration only pays for a truthiness check
+per stage.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from pydantic_db import Model
+
+
+class StageTiming(typing.NamedTuple):
+    """Timing details of a single hydration stage."""
+
+    stage: str
+    model: type[Model]
+    rows_in: int
+    models_out: int
+    seconds: float
+
+    @property
+    def fanout(self) -> float:
+        """Average number of input rows per output model (list field flattening fan out)."""
+        return self.rows_in / self.models_out if self.models_out else 0.0
+
+
+Profiler = typing.Callable[[StageTiming], None]
+
+# Registered callbacks, only ever mutated in place so imported references stay current.
+_profilers: list[Profiler] = []
+
+
+def add_profiler(profiler: Profiler) -> None:
+    """Register a callback to receive hydration stage timings."""
+    _profilers.append(profiler)
+
+
+def remove_profiler(profiler: Profiler) -> None:
+    """Unregister a hydration stage timing callback."""
+    _profilers.remove(profiler)
+
+
+@contextlib.contextmanager
+def profile(profiler: Profiler | None = None) -> typing.Generator[list[StageTiming]]:
+    """Collect hydration stage timings within a context.
+
+    Timings are passed to the provided callback, and collected into the
+    yielded list.
+
+        with profile() as timings:
+            User.from_results(results)
+    """
+    timings: list[StageTiming] = []
+
+    def collect(timing: StageTiming) -> None:
+        timings.append(timing)
+        if profiler is not None:
+            profiler(timing)
+
+    add_profiler(collect)
+    try:
+        yield timings
+    finally:
+        remove_profiler(collect)
+
+
+def record(stage: str, model: type[Model], rows_in: int, models_out: int, seconds: float) -> None:
+    """Report the timing of a stage to all registered callbacks."""
+    timing = StageTiming(stage, model, rows_in, models_out, seconds)
+    for profiler in tuple(_profilers):
+        profiler(timing)
@@ -40,6 +40,17 @@ def tests_coverage(context):
     context.run("pytest --cov -x --cov-report=xml")
 
 
+@invoke.task
+def benchmarks(context, compare=False, save=False, baseline=".benchmarks/baseline.json", threshold=0.2):
+    """Run hydration benchmarks, optionally saving or comparing against a baseline."""
+    args = f"--threshold {threshold}"
+    if save:
+        args += f" --save {baseline}"
+    if compare:
+        args += f" --compare {baseline}"
+    context.run(f"python -m benchmarks {args}")
+
+
 @invoke.task
 def infra_test_start(context):
     """Run local unittest infrastructure."""
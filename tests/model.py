@@ -52,3 +52,8 @@ class ModelG(Model):
     id: int
     models: list[ModelA] | None
     models_generic: typing.Union[list[ModelA], None] = None  # noqa: UP007
+
+
+class ModelH(Model):
+    id: int
+    models: list[ModelF]
@@ -31,6 +31,15 @@ class TestModel:
             ModelA(id=1, a="x"),
         ]
 
+    async def test_aiter_results(self, db_session):
+        cursor = db_session.cursor("select 1 as id, 'x' as a union all select 2 as id, 'y' as a", prefetch=1)
+        models = [model async for model in ModelA.aiter_results(cursor)]
+
+        assert models == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
 
 class TestNestedModel:
     async def test_from_result(self, db_session):
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import pickle
+from collections import UserDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import pytest
+from pydantic import ConfigDict, Field, ValidationError, field_serializer, field_validator, model_validator
 
-from pydantic_db import Model
+from pydantic_db import IdentityMap, IdentityMapStats, Model, ParallelHydrator, ResultGrouper
 from tests.model import ModelA, ModelB, ModelC, ModelD, ModelE, ModelF, ModelG
 
 
@@ -41,6 +46,73 @@ def test_hash():
     assert hash(m1) != hash(m3)
 
 
+class CompositeKey(Model):
+    _hash_fields = {"b", "a"}
+
+    a: int
+    b: str
+
+
+class FrozenModel(Model):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+
+
+def test_hash_composite_fields_do_not_collide():
+    m1 = CompositeKey(a=1, b="23")
+    m2 = CompositeKey(a=12, b="3")
+
+    assert hash(m1) != hash(m2)
+    assert {m1, m2} != {m1}
+
+
+def test_dict_key_ordered():
+    assert CompositeKey._dict_key({"b": "x", "a": 1}) == (1, "x")
+    assert CompositeKey._dict_key({"a": 1, "b": "x"}) == (1, "x")
+
+
+def test_flatten_data_composite_keys_do_not_collide():
+    class CompositeParent(Model):
+        _hash_fields = {"a", "b"}
+
+        a: int
+        b: str
+        models: list[ModelA]
+
+    results = [
+        {"a": 1, "b": "23", "models__id": 1, "models__a": "x"},
+        {"a": 12, "b": "3", "models__id": 2, "models__a": "y"},
+    ]
+
+    assert CompositeParent.from_results(results) == [
+        CompositeParent(a=1, b="23", models=[ModelA(id=1, a="x")]),
+        CompositeParent(a=12, b="3", models=[ModelA(id=2, a="y")]),
+    ]
+
+
+def test_hash_cached_on_frozen_models():
+    m = FrozenModel(id=1)
+
+    assert hash(m) == hash(FrozenModel(id=1))
+    assert m.__dict__["_pdb_hash"] == hash(m)
+    assert m.model_dump() == {"id": 1}
+
+
+def test_hash_cache_discarded_on_copy_update():
+    m = FrozenModel(id=1)
+    hash(m)
+
+    assert hash(m.model_copy(update={"id": 2})) == hash(FrozenModel(id=2))
+
+
+def test_hash_cache_not_pickled():
+    m = FrozenModel(id=1)
+    hash(m)
+
+    assert "_pdb_hash" not in pickle.loads(pickle.dumps(m)).__dict__  # noqa: S301
+
+
 class TestModel:
     def test_model_fields(self):
         assert ModelA._pdb_model_fields() == {}
@@ -61,6 +133,13 @@ class TestModel:
 
         assert model == ModelA(id=1, a="x")
 
+    def test_from_result_error_location(self):
+        with pytest.raises(ValidationError) as e:
+            ModelA.from_result({"id": "bad", "a": "y"})
+
+        assert e.value.title == "ModelA"
+        assert e.value.errors()[0]["loc"] == ("id",)
+
     def test_from_result_with_prefix(self):
         r = {"xxxid": 1, "xxxa": "x"}
         model = ModelA.from_result(r, prefix="xxx")
@@ -83,6 +162,61 @@ class TestModel:
             ModelA(id=1, a="x"),
         ]
 
+    def test_from_result_prefix_only_stripped_from_start(self):
+        r = {"xxxid": 1, "xxxa": "xxx", "xxxb__xxx": "y"}
+        model = ModelA.from_result(r, prefix="xxx")
+
+        assert model == ModelA(id=1, a="xxx")
+
+    def test_from_results_varying_columns(self):
+        results = [{"id": 1, "a": "x"}, {"a": "y", "id": 2}]
+        models = ModelA.from_results(results)
+
+        assert models == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
+    def test_iter_results(self):
+        results = [{"id": 1, "a": "x"}, {"id": 2, "a": "y"}]
+        models = ModelA.iter_results(iter(results))
+
+        assert next(models) == ModelA(id=1, a="x")
+        assert list(models) == [ModelA(id=2, a="y")]
+
+    def test_from_rows(self):
+        rows = [(1, "x"), (2, "y")]
+        models = ModelA.from_rows(rows, columns=["id", "a"])
+
+        assert models == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
+    def test_from_rows_with_description(self):
+        description = [("xxxid", None, None, None, None, None, None), ("xxxa", None, None, None, None, None, None)]
+        models = ModelA.from_rows([(1, "x")], columns=description, prefix="xxx")
+
+        assert models == [
+            ModelA(id=1, a="x"),
+        ]
+
+    def test_result_plan_cached(self):
+        plan = ModelA._result_plan(("xxxid", "xxxa", "other"), prefix="xxx")
+
+        assert plan is ModelA._result_plan(("xxxid", "xxxa", "other"), prefix="xxx")
+        assert plan.columns == (("id", 0), ("a", 1))
+
+
+class CacheChild(Model):
+    id: int
+    name: str
+
+
+class CacheParent(Model):
+    id: int
+    child: CacheChild
+
 
 class TestNestedModel:
     @pytest.mark.parametrize(
@@ -141,6 +275,23 @@ class TestNestedModel:
             b=ModelB(id=3, b="z"),
         )
 
+    @pytest.mark.parametrize(
+        ("kwargs", "loc"),
+        [
+            ({}, ("a", "id")),
+            ({"as_records": True}, ("a", "id")),
+            ({"identity_map": IdentityMap()}, ("a", "id")),
+            # Lazy nested models are validated on access.
+            ({"lazy": True}, ("id",)),
+        ],
+    )
+    def test_from_result_error_location(self, kwargs, loc):
+        r = {"id": 1, "d": "x", "a__id": "bad", "a__a": "y", "b__id": None, "b__b": None}
+        with pytest.raises(ValidationError) as e:
+            ModelD.from_result(r, **kwargs).a  # noqa: B018
+
+        assert e.value.errors()[0]["loc"] == loc
+
     def test_from_result_skips_optional(self):
         r = {"id": 1, "d": "x", "a__id": 2, "a__a": "y", "b__id": None, "b__b": None}
         model = ModelD.from_result(r)
@@ -152,6 +303,15 @@ class TestNestedModel:
             b=None,
         )
 
+    def test_result_plan(self):
+        plan = ModelD._result_plan(("id", "d", "a__id", "a__a", "b__id", "b__b"))
+
+        assert plan.columns == (("id", 0), ("d", 1))
+        assert [(child.field, child.skip_index, child.plan.columns) for child in plan.children] == [
+            ("a", 2, (("id", 2), ("a", 3))),
+            ("b", 4, (("id", 4), ("b", 5))),
+        ]
+
     def test_from_result_with_list_field(self):
         r = {"id": 1, "models__id": 2, "models__a": "y"}
         model = ModelF.from_result(r)
@@ -224,6 +384,117 @@ class TestNestedModel:
             ),
         ]
 
+    def test_iter_results_list_field(self):
+        consumed = []
+
+        def results():
+            for r in [
+                {"id": 1, "models__id": 1, "models__a": "x"},
+                {"id": 1, "models__id": 2, "models__a": "y"},
+                {"id": 2, "models__id": 3, "models__a": "z"},
+                {"id": 3, "models__id": 3, "models__a": "z"},
+            ]:
+                consumed.append(r["id"])
+                yield r
+
+        models = ModelF.iter_results(results())
+
+        assert next(models) == ModelF(id=1, models=[ModelA(id=1, a="x"), ModelA(id=2, a="y")])
+        # First parent is complete once the second parent is seen.
+        assert consumed == [1, 1, 2]
+        assert list(models) == [
+            ModelF(id=2, models=[ModelA(id=3, a="z")]),
+            ModelF(id=3, models=[ModelA(id=3, a="z")]),
+        ]
+
+    async def test_aiter_results_list_field(self):
+        async def results():
+            for r in [
+                {"id": 1, "models__id": 1, "models__a": "x"},
+                {"id": 1, "models__id": 2, "models__a": "y"},
+                {"id": 2, "models__id": 3, "models__a": "z"},
+            ]:
+                yield r
+
+        models = [model async for model in ModelF.aiter_results(results())]
+
+        assert models == [
+            ModelF(id=1, models=[ModelA(id=1, a="x"), ModelA(id=2, a="y")]),
+            ModelF(id=2, models=[ModelA(id=3, a="z")]),
+        ]
+
+    def test_iter_results_empty(self):
+        assert list(ModelF.iter_results([])) == []
+
+    def test_prepare_children_without_hash_fields(self):
+        data = [
+            {"id": 1, "models": {"a": "x", "b": "y"}},
+            {"id": 1, "models": {"b": "y", "a": "x"}},
+            {"id": 1, "models": {"a": "z", "b": "y"}},
+        ]
+
+        assert ModelF._prepare(data) == [
+            {"id": 1, "models": [{"a": "x", "b": "y"}, {"a": "z", "b": "y"}]},
+        ]
+
+    def test_prepare_unhashable_children(self):
+        data = [
+            {"id": 1, "models": {"id": [1], "a": "x"}},
+            {"id": 1, "models": {"id": [1], "a": "x"}},
+            {"id": 1, "models": {"id": [2], "a": "x"}},
+        ]
+
+        assert ModelF._prepare(data) == [
+            {"id": 1, "models": [{"id": [1], "a": "x"}, {"id": [2], "a": "x"}]},
+        ]
+
+    def test_from_results_validated_in_single_call(self):
+        results = [
+            {"id": 1, "models__id": 1, "models__a": "x"},
+            {"id": 1, "models__id": 2, "models__a": "y"},
+        ]
+
+        assert ModelF._list_adapter() is ModelF._list_adapter()
+        assert ModelF._prepare(ModelF._parse_results(results)) == [
+            {"id": 1, "models": [{"id": 1, "a": "x"}, {"id": 2, "a": "y"}]},
+        ]
+
+    def test_from_results_invalid_child(self):
+        results = [{"id": 1, "d": "x", "a__id": "invalid", "a__a": "y", "b__id": None}]
+
+        with pytest.raises(ValidationError) as e:
+            ModelD.from_results(results)
+
+        assert e.value.errors()[0]["loc"] == (0, "a", "id")
+
+    def test_from_result_with_aggregated_list_field(self):
+        r = {"id": 1, "models": [{"id": 2, "a": "y"}, {"id": 3, "a": "z"}]}
+        model = ModelF.from_result(r)
+
+        assert model == ModelF(
+            id=1,
+            models=[ModelA(id=2, a="y"), ModelA(id=3, a="z")],
+        )
+
+    def test_from_rows_list_field(self):
+        rows = [
+            (1, 1, "x"),
+            (1, 2, "y"),
+            (2, None, None),
+        ]
+        models = ModelG.from_rows(rows, columns=["id", "models__id", "models__a"])
+
+        assert models == [
+            ModelG(
+                id=1,
+                models=[
+                    ModelA(id=1, a="x"),
+                    ModelA(id=2, a="y"),
+                ],
+            ),
+            ModelG(id=2, models=None),
+        ]
+
     @pytest.mark.parametrize(
         ("model", "expected_fields"),
         [
@@ -234,6 +505,51 @@ class TestNestedModel:
     def test_sortable_fields(self, model, expected_fields):
         assert model.sortable_fields() == expected_fields
 
+    def test_sortable_field_set(self):
+        assert ModelE.sortable_field_set() == frozenset(ModelE.sortable_fields())
+        assert ModelE.sortable_field_set(recurse=False) == {"id", "e"}
+
+    def test_cached_columns_are_copies(self):
+        ModelD.sortable_fields().append("x")
+        ModelD.as_columns().append(("x",))
+        ModelD.as_typed_columns("t")[("x",)] = str
+
+        assert "x" not in ModelD.sortable_fields()
+        assert ("x",) not in ModelD.as_columns()
+        assert ("x",) not in ModelD.as_typed_columns("t")
+
+    def test_select_columns(self):
+        columns = ModelE.select_columns({"": "e", "d": "d", "d__a": "a", "d__b": "b"})
+
+        assert columns == (
+            "e.id, e.e, d.id AS d__id, d.d AS d__d, a.id AS d__a__id, a.a AS d__a__a, b.id AS d__b__id, b.b AS d__b__b"
+        )
+
+    def test_select_columns_missing_alias(self):
+        with pytest.raises(ValueError, match="No table alias for nested field 'd__b' of ModelE"):
+            ModelE.select_columns({"": "e", "d": "d", "d__a": "a"})
+
+    def test_select_columns_unaliased(self):
+        assert ModelD.select_columns() == "id, d, a__id, a__a, b__id, b__b"
+
+    def test_clear_cache(self, monkeypatch):
+        assert CacheParent.sortable_field_set() == {"id", "child__id", "child__name"}
+
+        monkeypatch.setattr(CacheChild, "_skip_sortable_fields", {"name"})
+        Model.clear_cache()
+
+        assert CacheParent.sortable_field_set() == {"id", "child__id"}
+        assert CacheParent.sortable_fields() == ["child__id", "id"]
+
+    def test_model_rebuild_clears_cache(self):
+        assert ModelD.sortable_field_set()
+        assert ModelD.__dict__["_cached_sortable_fields"]
+
+        ModelA.model_rebuild(force=True)
+
+        assert ModelD.__dict__["_cached_sortable_fields"] is None
+        assert ModelD.from_result({"id": 1, "d": "x", "a__id": 2, "a__a": "y"}).a == ModelA(id=2, a="y")
+
 
 class Basic(Model):
     id: int
@@ -268,6 +584,702 @@ class CircularB(Model):
     a: CircularA
 
 
+class TestParallelHydrator:
+    def test_from_results_keeps_parent_groups(self):
+        # Interleaved parents, each parent is hydrated by a single worker.
+        results = [{"id": i % 5, "models__id": i, "models__a": str(i)} for i in range(40)]
+        with ParallelHydrator(2, min_chunk_size=1) as hydrator:
+            models = hydrator.from_results(ModelF, results)
+
+        assert models == ModelF.from_results(results)
+        assert [m.id for m in models] == [0, 1, 2, 3, 4]
+        assert [m.id for m in models[0].models] == [0, 5, 10, 15, 20, 25, 30, 35]
+
+    def test_from_rows_keeps_order(self):
+        rows = [(i, str(i)) for i in range(20)]
+        with ParallelHydrator(2, min_chunk_size=1) as hydrator:
+            models = hydrator.from_rows(ModelA, rows, ["id", "a"])
+
+        assert models == [ModelA(id=i, a=str(i)) for i in range(20)]
+
+    def test_from_results_workers(self):
+        results = [{"id": i, "models__id": 1, "models__a": "x"} for i in range(3)]
+
+        assert ModelF.from_results(results, workers=2) == [ModelF(id=i, models=[ModelA(id=1, a="x")]) for i in range(3)]
+
+    @pytest.mark.parametrize("kwargs", [{"presorted": True}, {"presorted": True, "check_sorted": True}])
+    def test_from_results_workers_presorted(self, kwargs):
+        with pytest.raises(ValueError, match="Presorted results can not be hydrated by worker processes"):
+            ModelF.from_results([{"id": 1, "models__id": 1, "models__a": "x"}], workers=2, **kwargs)
+
+    def test_from_results_mixed_columns(self):
+        results = [{"id": 1, "a": "x"}, {"a": "y", "id": 2}]
+        with ParallelHydrator(2, min_chunk_size=1) as hydrator:
+            models = hydrator.from_results(ModelA, results)
+
+        assert models == [ModelA(id=1, a="x"), ModelA(id=2, a="y")]
+
+
+class UnpicklableRecord(UserDict):
+    def __reduce__(self):
+        msg = "Records can not be pickled."
+        raise TypeError(msg)
+
+
+class TestAsyncHydration:
+    async def test_afrom_results(self):
+        results = [{"id": i % 3, "models__id": i, "models__a": str(i)} for i in range(10)]
+        models = await ModelF.afrom_results(results, chunk_size=2)
+
+        assert models == ModelF.from_results(results)
+
+    async def test_afrom_results_yields_to_loop(self):
+        ticks = []
+
+        async def tick():
+            for i in range(3):
+                ticks.append(i)
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(tick())
+        models = await ModelA.afrom_results([{"id": i, "a": "x"} for i in range(4)], chunk_size=1)
+
+        # The other task ran while results were hydrated.
+        assert ticks == [0, 1, 2]
+        assert [m.id for m in models] == [0, 1, 2, 3]
+        await task
+
+    async def test_afrom_results_executor(self):
+        results = [{"id": "1", "a": "x"}]
+        with ThreadPoolExecutor() as executor:
+            models = await ModelA.afrom_results(results, executor=executor)
+
+        assert [m.id for m in models] == [1]
+
+    async def test_afrom_results_process_executor(self):
+        # Driver records (i.e. asyncpg) can't be pickled.
+        results = [UnpicklableRecord({"id": 1, "models__id": i, "models__a": str(i)}) for i in range(2)]
+        with ProcessPoolExecutor(1) as executor:
+            models = await ModelF.afrom_results(results, executor=executor)
+
+        assert models == [ModelF(id=1, models=[ModelA(id=0, a="0"), ModelA(id=1, a="1")])]
+
+    async def test_afrom_results_executor_mixed_columns(self):
+        results = [UnpicklableRecord({"id": 1, "a": "x"}), UnpicklableRecord({"a": "y", "id": 2})]
+        with ProcessPoolExecutor(1) as executor:
+            models = await ModelA.afrom_results(results, executor=executor)
+
+        assert models == [ModelA(id=1, a="x"), ModelA(id=2, a="y")]
+
+    async def test_afrom_results_shares_repeated_nested_results(self):
+        results = [{"id": i, "parent__id": 1, "parent__child__id": 1, "parent__child__a": "y"} for i in range(4)]
+        models = await SharingParent.afrom_results(results, chunk_size=2)
+
+        assert models[0].parent is models[1].parent
+
+    async def test_aone(self):
+        results = [
+            {"id": 1, "models__id": 1, "models__a": "x"},
+            {"id": 1, "models__id": 2, "models__a": "y"},
+        ]
+
+        assert await ModelF.aone(results) == ModelF(id=1, models=[ModelA(id=1, a="x"), ModelA(id=2, a="y")])
+        assert await ModelA.aone({"id": 1, "a": "x"}) == ModelA(id=1, a="x")
+
+    async def test_aone_error_location(self):
+        with pytest.raises(ValidationError) as e:
+            await ModelA.aone({"id": "bad", "a": "y"})
+
+        assert e.value.errors()[0]["loc"] == ("id",)
+
+
+class FullNameModel(Model):
+    id: int
+    full_name: str
+    email: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def build_full_name(cls, data):
+        return {"full_name": f"{data.pop('first')} {data.pop('last')}", **data}
+
+    @field_validator("full_name")
+    @classmethod
+    def capitalize(cls, value):
+        return value.capitalize()
+
+
+class TestProjection:
+    def test_from_result_include(self):
+        r = {"id": 0, "e": "w", "d__id": 1, "d__d": "x", "d__a__id": 2, "d__a__a": "y", "d__b__id": None}
+        model = ModelE.from_result(r, include={"e", "d__a__a"})
+
+        assert model.model_dump(by_alias=True) == {"id": 0, "e": "w", "d": {"id": 1, "a": {"id": 2, "a": "y"}}}
+
+    def test_from_results_include_list_field(self):
+        results = [
+            {"id": 1, "models__id": 1, "models__a": "x"},
+            {"id": 1, "models__id": 2, "models__a": "y"},
+        ]
+        models = ModelF.from_results(results, include={"models__id"})
+
+        assert [m.model_dump() for m in models] == [{"id": 1, "models": [{"id": 1}, {"id": 2}]}]
+
+    def test_include_nested_model(self):
+        projection = ModelD.projection({"a", "a__a"})
+
+        assert set(projection.model_fields) == {"id", "a"}
+        assert projection.model_fields["a"].annotation == ModelA | None
+
+    def test_projection_cached(self):
+        assert ModelD.projection(["d"]) is ModelD.projection({"d"})
+        assert ModelD.projection(["d"]) is not ModelD.projection({"a__a"})
+
+    def test_projection_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown field 'd__x'"):
+            ModelD.projection({"d__x"})
+
+    def test_projection_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(ModelD, "_projection_cache_size", 2)
+        projection = ModelD.projection({"d"})
+        ModelD.projection({"a"})
+        assert ModelD.projection({"d"}) is projection
+
+        ModelD.projection({"b"})
+        ModelD.projection({"a__a"})
+
+        assert ModelD.projection({"d"}) is not projection
+        assert len(ModelD.__dict__["_cached_projections"]) == 2  # noqa: PLR2004
+
+    def test_projection_validators(self):
+        projection = FullNameModel.projection({"full_name"})
+
+        assert projection.from_result({"id": 1, "first": "a", "last": "b"}).model_dump() == {
+            "id": 1,
+            "full_name": "A b",
+        }
+
+    def test_projection_workers(self):
+        with pytest.raises(ValueError, match="Projections can not be hydrated by worker processes"):
+            ModelA.from_results([{"id": 1, "a": "x"}], include={"a"}, workers=2)
+
+    def test_unknown_columns_skipped(self):
+        projection = ModelA.projection({"a"})
+
+        assert projection._parse_result({"id": 1, "a": "x", "b": "y"}) == {"id": 1, "a": "x"}
+
+    def test_unknown_columns_kept(self):
+        assert ModelA._parse_result({"id": 1, "a": "x", "b": "y"}) == {"id": 1, "a": "x", "b": "y"}
+        assert FullNameModel.from_result({"id": 1, "first": "a", "last": "b"}).full_name == "A b"
+
+    def test_extra_allowed_columns_kept(self):
+        class ExtraModel(Model):
+            model_config = ConfigDict(extra="allow")
+
+            id: int
+
+        assert ExtraModel._parse_result({"id": 1, "b": "y"}) == {"id": 1, "b": "y"}
+
+
+class TestLazyResults:
+    results = [
+        {"id": 1, "models__id": 1, "models__a": "x"},
+        {"id": 1, "models__id": 2, "models__a": "y"},
+        {"id": 2, "models__id": None, "models__a": None},
+    ]
+
+    def test_from_results_lazy(self):
+        models = ModelF.from_results(self.results, lazy=True)
+
+        assert "models" not in models[0].__dict__
+        assert models[0].models == [ModelA(id=1, a="x"), ModelA(id=2, a="y")]
+        assert "models" in models[0].__dict__
+        assert models[1].models == []
+
+    def test_lazy_models_equal(self):
+        models = ModelF.from_results(self.results, lazy=True)
+
+        assert isinstance(models[0], ModelF)
+        assert models == ModelF.from_results(self.results)
+        assert ModelF.from_results(self.results) == models
+
+    def test_lazy_serialization(self):
+        r = {"id": 0, "e": "w", "d__id": 1, "d__d": "x", "d__a__id": 2, "d__a__a": "y", "d__b__id": None}
+        model = ModelE.from_result(r, lazy=True)
+
+        assert model.model_dump(by_alias=True) == {
+            "id": 0,
+            "e": "w",
+            "d": {"id": 1, "d": "x", "a": {"id": 2, "a": "y"}, "b": None},
+        }
+
+    def test_lazy_nested_models_are_lazy(self):
+        r = {"id": 0, "e": "w", "d__id": 1, "d__d": "x", "d__a__id": 2, "d__a__a": "y", "d__b__id": None}
+        model = ModelE.from_result(r, lazy=True)
+
+        assert "a" not in model.d.__dict__
+        assert model.d.a == ModelA(id=2, a="y")
+
+    def test_lazy_model_name(self):
+        model = ModelF.from_results(self.results, lazy=True)[0]
+
+        assert type(model).__name__ == "ModelFLazy"
+        assert type(model).__qualname__ == "ModelFLazy"
+
+    def test_lazy_repr(self):
+        model = ModelF.from_results(self.results, lazy=True)[0]
+
+        assert repr(model) == "ModelFLazy(id=1, models=<pending>)"
+        assert "models" not in model.__dict__
+
+    def test_lazy_pickle(self):
+        r = {"id": 0, "e": "w", "d__id": 1, "d__d": "x", "d__a__id": 2, "d__a__a": "y", "d__b__id": None}
+        model = pickle.loads(pickle.dumps(ModelE.from_result(r, lazy=True)))  # noqa: S301
+
+        assert type(model) is ModelE
+        assert type(model.d) is ModelD
+        assert model == ModelE.from_result(r)
+
+    def test_lazy_validation_deferred(self):
+        model = ModelD.from_result({"id": 1, "d": "x", "a__id": "y", "a__a": "y"}, lazy=True)
+
+        with pytest.raises(ValidationError):
+            model.a  # noqa: B018
+
+    def test_lazy_workers(self):
+        with pytest.raises(ValueError, match="Lazy results"):
+            ModelF.from_results(self.results, lazy=True, workers=2)
+
+
+class TestRecords:
+    results = [
+        {"id": 1, "models__id": 1, "models__a": "x"},
+        {"id": 1, "models__id": 2, "models__a": "y"},
+        {"id": 2, "models__id": None, "models__a": None},
+    ]
+
+    def test_from_results_as_records(self):
+        records = ModelF.from_results(self.results, as_records=True)
+
+        assert [(r.id, [(m.id, m.a) for m in r.models]) for r in records] == [(1, [(1, "x"), (2, "y")]), (2, [])]
+        assert not hasattr(records[0], "__dict__")
+        assert type(records[0]).__name__ == "ModelFRecord"
+
+    def test_records_read_only(self):
+        record = ModelA.from_result({"id": 1, "a": "x"}, as_records=True)
+
+        with pytest.raises(AttributeError):
+            record.a = "y"
+
+    def test_records_hash_fields(self):
+        r1 = CompositeKey.from_result({"a": 1, "b": "x"}, as_records=True)
+        r2 = CompositeKey.from_result({"a": 1, "b": "y"}, as_records=True)
+
+        assert hash(r1) == hash(CompositeKey(a=1, b="x"))
+        assert hash(r1) != hash(r2)
+
+    def test_records_eq_excluded_fields(self):
+        r1 = ModelC.from_result(
+            {"id": 1, "c": "x", "updated": datetime(2020, 1, 1, tzinfo=timezone.utc)},
+            as_records=True,
+        )
+        r2 = ModelC.from_result(
+            {"id": 1, "c": "x", "updated": datetime(2021, 1, 1, tzinfo=timezone.utc)},
+            as_records=True,
+        )
+        r3 = ModelC.from_result(
+            {"id": 1, "c": "y", "updated": datetime(2021, 1, 1, tzinfo=timezone.utc)},
+            as_records=True,
+        )
+
+        assert r1 == r2
+        assert r1 != r3
+
+    def test_records_validated(self):
+        record = ModelA.from_result({"id": "1", "a": "x"}, as_records=True)
+
+        assert record.id == 1
+        with pytest.raises(ValidationError):
+            ModelA.from_result({"id": "x", "a": "x"}, as_records=True)
+
+    def test_circular_records(self):
+        CircularA.clear_cache()
+        CircularB.clear_cache()
+        a = CircularA.from_result({"id": 1, "b__id": 2, "b__a__id": 3}, as_records=True)
+        b = CircularB.from_result({"id": 1, "a__id": 2, "a__b__id": 3}, as_records=True)
+
+        assert type(a).__name__ == "CircularARecord"
+        assert type(a.b).__name__ == "CircularBRecord"
+        assert type(b.a).__name__ == "CircularARecord"
+        assert (a.b.a["id"], b.a.b.id) == (3, 3)
+
+    def test_records_lazy(self):
+        with pytest.raises(ValueError, match="Lazy results can not be returned as records"):
+            ModelF.from_results(self.results, as_records=True, lazy=True)
+
+
+class TestJson:
+    results = [
+        {"id": 1, "models__id": 1, "models__a": "x"},
+        {"id": 1, "models__id": 2, "models__a": "y"},
+        {"id": 2, "models__id": None, "models__a": None},
+    ]
+    expected = b'[{"id":1,"models":[{"id":1,"a":"x"},{"id":2,"a":"y"}]},{"id":2,"models":[]}]'
+
+    def test_results_to_json(self):
+        assert ModelF.results_to_json(self.results) == self.expected
+
+    def test_results_to_json_unvalidated(self):
+        assert ModelF.results_to_json(self.results, validate=False) == self.expected
+
+    def test_results_to_json_unvalidated_field_names(self):
+        results = [
+            {
+                "id": 1,
+                "e": "x",
+                "d__id": 2,
+                "d__d": "y",
+                "d__a__id": None,
+                "d__a__a": None,
+                "d__b__id": None,
+                "d__b__b": None,
+            },
+        ]
+
+        assert ModelE.results_to_json(results, validate=False) == ModelE.results_to_json(results)
+
+    def test_results_to_json_unvalidated_exclude(self):
+        class Excluded(Model):
+            id: int
+            secret: str = Field(exclude=True)
+            name: str = "x"
+
+        results = [{"id": 1, "secret": "s", "unknown": 1}]
+
+        assert Excluded.results_to_json(results, validate=False) == b'[{"id":1,"name":"x"}]'
+
+    def test_results_to_json_unvalidated_serializer(self):
+        class Serialized(Model):
+            id: int
+
+            @field_serializer("id")
+            def _serialize_id(self, value: int) -> str:
+                return str(value)
+
+        assert Serialized.results_to_json([{"id": "1"}], validate=False) == b'[{"id":"1"}]'
+
+    def test_results_to_json_validates(self):
+        assert ModelA.results_to_json([{"id": "1", "a": "x"}]) == b'[{"id":1,"a":"x"}]'
+        with pytest.raises(ValidationError):
+            ModelA.results_to_json([{"id": "x", "a": "x"}])
+
+    def test_results_to_json_serializes_fields(self):
+        r = {"id": 1, "c": "x", "updated": datetime(2020, 1, 1, tzinfo=timezone.utc)}
+
+        assert ModelC.results_to_json([r]) == f"[{ModelC(**r).model_dump_json()}]".encode()
+
+    @pytest.mark.parametrize(("chunk_size", "chunks"), [(1, 3), (2, 3), (1000, 2)])
+    def test_iter_results_json(self, chunk_size, chunks):
+        chunks_ = list(ModelF.iter_results_json(self.results, chunk_size=chunk_size))
+
+        assert b"".join(chunks_) == self.expected
+        assert len(chunks_) == chunks
+
+    def test_iter_results_json_empty(self):
+        assert b"".join(ModelF.iter_results_json([])) == b"[]"
+
+
+class TestToRows:
+    model = ModelE(id=0, e="w", d=ModelD(id=1, d="x", a=ModelA(id=2, a="y"), b=None))
+
+    def test_to_rows(self):
+        assert list(ModelE.to_rows([self.model])) == [(0, "w", 1, "x", 2, "y", None, None)]
+
+    def test_to_rows_columns(self):
+        assert list(ModelE.to_rows([self.model], ["id", "d__a__a", "d__b__b"])) == [(0, "y", None)]
+        assert list(ModelA.to_rows([ModelA(id=1, a="x")], ["a"])) == [("x",)]
+
+    def test_to_rows_chunks(self):
+        models = [ModelA(id=i, a="x") for i in range(5)]
+
+        assert list(ModelA.to_rows(models, chunk_size=2)) == [
+            [(0, "x"), (1, "x")],
+            [(2, "x"), (3, "x")],
+            [(4, "x")],
+        ]
+
+    def test_to_rows_skips_list_fields(self):
+        assert list(ModelF.to_rows([ModelF(id=1, models=[ModelA(id=1, a="x")])])) == [(1,)]
+
+    def test_to_rows_list_field_column(self):
+        with pytest.raises(ValueError, match="part of a list field"):
+            ModelF.to_rows([], ["models__id"])
+
+    def test_to_rows_no_columns(self):
+        with pytest.raises(ValueError, match="No columns to flatten ModelA to"):
+            ModelA.to_rows([ModelA(id=1, a="x")], [])
+
+    def test_to_rows_unknown_column(self):
+        with pytest.raises(ValueError, match="Unknown column 'x' for ModelD"):
+            ModelE.to_rows([], ["d__x"])
+
+    def test_to_rows_round_trip(self):
+        columns = ["__".join(column) for column in ModelE.as_columns()]
+        (row,) = ModelE.to_rows([self.model])
+
+        assert ModelE.from_rows([row], columns) == [self.model]
+
+
+class FrozenChild(Model):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    a: str
+
+
+class FrozenParent(Model):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    child: FrozenChild | None
+
+
+class MixedParent(Model):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    child: FrozenChild
+    mutable: ModelA
+
+
+class SharingParent(Model):
+    id: int
+    parent: FrozenParent | None = None
+    mixed: MixedParent | None = None
+    children: list[FrozenChild] = []
+
+
+class TestMemoization:
+    def test_repeated_children_are_shared(self):
+        results = [{"id": i, "parent__id": 1, "parent__child__id": 1, "parent__child__a": "y"} for i in range(3)]
+        models = SharingParent.from_results(results)
+
+        assert models[0].parent is models[1].parent is models[2].parent
+        assert models[0].parent.child is models[1].parent.child
+        assert models[2] == SharingParent(id=2, parent=FrozenParent(id=1, child=FrozenChild(id=1, a="y")))
+
+    def test_mutable_children_are_not_shared(self):
+        results = [{"id": i, "d": "x", "a__id": 1, "a__a": "y", "b__id": None, "b__b": None} for i in range(2)]
+        models = ModelD.from_results(results)
+        models[0].a.a = "changed"
+
+        assert models[0].a is not models[1].a
+        assert models[1].a.a == "y"
+
+    def test_frozen_children_with_mutable_children_are_not_shared(self):
+        results = [
+            {
+                "id": i,
+                "mixed__id": 1,
+                "mixed__child__id": 1,
+                "mixed__child__a": "y",
+                "mixed__mutable__id": 1,
+                "mixed__mutable__a": "z",
+            }
+            for i in range(2)
+        ]
+        models = SharingParent.from_results(results)
+
+        assert models[0].mixed is not models[1].mixed
+        assert models[0].mixed.mutable is not models[1].mixed.mutable
+        assert models[0].mixed.child is models[1].mixed.child
+
+    def test_changed_children_are_not_shared(self):
+        results = [
+            {"id": 1, "parent__id": 1, "parent__child__id": 1, "parent__child__a": "y"},
+            {"id": 2, "parent__id": 1, "parent__child__id": 1, "parent__child__a": "changed"},
+        ]
+        models = SharingParent.from_results(results)
+
+        assert [model.parent.child.a for model in models] == ["y", "changed"]
+
+    def test_list_children_are_shared(self):
+        results = [
+            {"id": i, "parent__id": 1, "parent__child__id": None, "children__id": j, "children__a": "x"}
+            for i in range(2)
+            for j in range(2)
+        ]
+        models = SharingParent.from_results(results)
+
+        assert models[0].children[0] is models[1].children[0]
+        assert models[0].children[1] is models[1].children[1]
+
+    def test_sharing(self):
+        assert SharingParent._sharing() == (False, True)
+        assert FrozenParent._sharing() == (True, True)
+        assert MixedParent._sharing() == (False, True)
+        assert FrozenChild._sharing() == (True, False)
+        assert ModelE._sharing() == (False, False)
+
+    def test_validation_error_location(self):
+        results = [{"id": i, "parent__id": 1, "parent__child__id": 1, "parent__child__a": None} for i in range(2)]
+        with pytest.raises(ValidationError) as e:
+            SharingParent.from_results(results)
+
+        assert e.value.errors()[0]["loc"] == (0, "parent", "child", "a")
+
+
+class TestPresorted:
+    results = [
+        {"id": 0, "models__id": 1, "models__children__id": None},
+        {"id": 0, "models__id": 2, "models__children__id": 1},
+        {"id": 0, "models__id": 2, "models__children__id": 2},
+        {"id": 1, "models__id": 3, "models__children__id": 3},
+        {"id": 1, "models__id": 3, "models__children__id": 3},
+        {"id": 2, "models__id": None, "models__children__id": None},
+    ]
+
+    def test_from_results(self):
+        assert Complex.from_results(self.results, presorted=True) == Complex.from_results(self.results)
+
+    def test_from_results_without_list_fields(self):
+        results = [{"id": 1, "a": "x"}, {"id": 1, "a": "x"}]
+
+        assert ModelA.from_results(results, presorted=True) == [ModelA(id=1, a="x"), ModelA(id=1, a="x")]
+
+    def test_from_results_not_ordered(self):
+        results = [*self.results, {"id": 0, "models__id": 4, "models__children__id": None}]
+
+        with pytest.raises(ValueError, match=r"Results are not ordered by Complex, rows for \(0,\) are not adjacent."):
+            Complex.from_results(results, presorted=True, check_sorted=True)
+
+    def test_from_results_not_ordered_unchecked(self):
+        results = [*self.results, {"id": 0, "models__id": 4, "models__children__id": None}]
+
+        assert [model.id for model in Complex.from_results(results, presorted=True)] == [0, 1, 2, 0]
+
+    def test_iter_results_not_ordered(self):
+        results = [
+            {"id": 1, "models__id": 1, "models__a": "x"},
+            {"id": 2, "models__id": 2, "models__a": "y"},
+            {"id": 1, "models__id": 3, "models__a": "z"},
+        ]
+
+        with pytest.raises(ValueError, match="Results are not ordered by ModelF"):
+            list(ModelF.iter_results(results, check_sorted=True))
+
+    def test_iter_results_json_not_ordered(self):
+        results = [
+            {"id": 1, "models__id": 1, "models__a": "x"},
+            {"id": 2, "models__id": 2, "models__a": "y"},
+            {"id": 1, "models__id": 3, "models__a": "z"},
+        ]
+
+        with pytest.raises(ValueError, match="Results are not ordered by ModelF"):
+            list(ModelF.iter_results_json(results, check_sorted=True))
+
+    def test_iter_results_constant_memory(self):
+        results = [{"id": i, "models__id": i, "models__a": "x"} for i in range(3)]
+        grouper = ResultGrouper(ModelF)
+        for row in ModelF._parse_results(results):
+            grouper.push(row)
+
+        assert grouper.completed is None
+        assert [model.id for model in ModelF.iter_results(results)] == [0, 1, 2]
+
+
+class TestIdentityMap:
+    result = {"id": 1, "d": "x", "a__id": 2, "a__a": "y", "b__id": None, "b__b": None}
+
+    def test_from_results_shares_instances(self):
+        identity_map = IdentityMap()
+        (first,) = ModelD.from_results([self.result], identity_map=identity_map)
+        (second,) = ModelD.from_results([dict(self.result)], identity_map=identity_map)
+
+        assert second is first
+        assert first == ModelD(id=1, d="x", a=ModelA(id=2, a="y"), b=None)
+        assert identity_map.stats() == IdentityMapStats(hits=2, misses=2, evictions=0, size=2)
+
+    def test_shares_nested_instances(self):
+        identity_map = IdentityMap()
+        first = ModelD.from_result(self.result, identity_map=identity_map)
+        second = ModelD.from_result({**self.result, "d": "changed"}, identity_map=identity_map)
+
+        assert second is not first
+        assert second.d == "changed"
+        assert second.a is first.a
+
+    def test_shares_list_children(self):
+        identity_map = IdentityMap()
+        results = [{"id": 1, "models__id": 1, "models__a": "x"}, {"id": 1, "models__id": 2, "models__a": "y"}]
+        (first,) = ModelF.from_results(results, identity_map=identity_map)
+        (second,) = ModelF.from_results([{"id": 2, "models__id": 2, "models__a": "y"}], identity_map=identity_map)
+
+        assert second.models[0] is first.models[1]
+
+    def test_changed_results_are_not_shared(self):
+        identity_map = IdentityMap()
+        first = ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map)
+        second = ModelA.from_result({"id": 1, "a": "y"}, identity_map=identity_map)
+        third = ModelA.from_result({"id": 1, "a": "y"}, identity_map=identity_map)
+
+        assert second is not first
+        assert second.a == "y"
+        assert third is second
+
+    def test_lru_eviction(self):
+        identity_map = IdentityMap(maxsize=2)
+        one = ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map)
+        ModelA.from_result({"id": 2, "a": "x"}, identity_map=identity_map)
+        ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map)
+        ModelA.from_result({"id": 3, "a": "x"}, identity_map=identity_map)
+
+        assert ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map) is one
+        assert identity_map.stats() == IdentityMapStats(hits=2, misses=3, evictions=1, size=2)
+
+    def test_ttl_eviction(self):
+        now = [0.0]
+        identity_map = IdentityMap(ttl=10, clock=lambda: now[0])
+        first = ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map)
+        now[0] = 5
+        assert ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map) is first
+
+        now[0] = 10
+        assert ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map) is not first
+        assert identity_map.stats().evictions == 1
+
+    def test_clear(self):
+        identity_map = IdentityMap()
+        ModelA.from_result({"id": 1, "a": "x"}, identity_map=identity_map)
+        identity_map.clear()
+
+        assert len(identity_map) == 0
+        assert identity_map.stats() == IdentityMapStats(hits=0, misses=0, evictions=0, size=0)
+
+    @pytest.mark.parametrize("kwargs", [{"lazy": True}, {"as_records": True}, {"workers": 2}])
+    def test_unsupported(self, kwargs):
+        with pytest.raises(ValueError, match="can not be"):
+            ModelA.from_results([{"id": 1, "a": "x"}], identity_map=IdentityMap(), **kwargs)
+
+    def test_shared_instances_are_validated(self):
+        class Upper(Model):
+            id: int
+            a: str
+
+            @field_validator("a")
+            @classmethod
+            def _upper(cls, value: str) -> str:
+                return value.upper()
+
+        identity_map = IdentityMap()
+        results = [{"id": "1", "a": "x"}]
+        (first,) = Upper.from_results(results, identity_map=identity_map)
+        (second,) = Upper.from_results(results, identity_map=identity_map)
+
+        assert second is first
+        assert (first.id, first.a) == (1, "X")
+
+
 class TestComplexScenarios:
     def test_multi_layer_nesting(self):
         r = {"id": 0, "e": "w", "d__id": 1, "d__d": "x", "d__a__id": 2, "d__a__a": "y", "d__b__id": 3, "d__b__b": "z"}
@@ -307,6 +1319,20 @@ class TestComplexScenarios:
             Complex(id=2, models=[]),
         ]
 
+    def test_multi_layer_list_nesting_unordered(self):
+        results = [
+            {"id": 0, "models__id": 2, "models__children__id": 1},
+            {"id": 1, "models__id": 3, "models__children__id": 3},
+            {"id": 0, "models__id": 1, "models__children__id": None},
+            {"id": 1, "models__id": 3, "models__children__id": 3},
+            {"id": 0, "models__id": 2, "models__children__id": 2},
+        ]
+
+        assert Complex._prepare(Complex._parse_results(results)) == [
+            {"id": 0, "models": [{"id": 2, "children": [{"id": 1}, {"id": 2}]}, {"id": 1, "children": []}]},
+            {"id": 1, "models": [{"id": 3, "children": [{"id": 3}]}]},
+        ]
+
     def test_multi_layer_list_nesting_all(self):
         results = [
             {"id": 0, "models__id": 1, "models__children__id": None},
@@ -372,6 +1398,21 @@ class TestComplexScenarios:
             ],
         )
 
+    def test_nested_model_with_list_field(self):
+        class Parent(Model):
+            id: int
+            f: ModelF
+
+        results = [
+            {"id": 0, "f__id": 1, "f__models__id": 2, "f__models__a": "x"},
+            {"id": 1, "f__id": 1, "f__models__id": 2, "f__models__a": "x"},
+        ]
+
+        assert Parent.from_results(results) == [
+            Parent(id=0, f=ModelF(id=1, models=[ModelA(id=2, a="x")])),
+            Parent(id=1, f=ModelF(id=1, models=[ModelA(id=2, a="x")])),
+        ]
+
     def test_circular_model_fields(self):
         assert CircularA._pdb_model_fields() == {
             "b": (CircularB, False, False),
@@ -0,0 +1,170 @@
+import enum
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from pydantic_db import CopyEncoder, Model
+from pydantic_db.pg_copy import CODECS, postgres_type
+from tests.model import ModelA, ModelB, ModelD, ModelF
+
+HEADER = b"PGCOPY\n\xff\r\n\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+TRAILER = b"\xff\xff"
+
+
+class Colour(str, enum.Enum):
+    red = "red"
+
+
+class CopyModel(Model):
+    id: int
+    colour: Colour
+    created: datetime
+    tags: dict | None = None
+
+
+MODELS = [
+    ModelD(id=1, d="x", a=ModelA(id=2, a="y"), b=None),
+    ModelD(id=3, d="a\tb\\c\n", a=None, b=ModelB(id=4, b="z")),
+]
+
+
+class TestCopyEncoder:
+    def test_columns(self):
+        assert CopyEncoder(ModelD).columns == ("id", "d", "a__id", "a__a", "b__id", "b__b")
+        assert CopyEncoder(ModelF).columns == ("id",)
+
+    def test_types(self):
+        encoder = CopyEncoder(CopyModel, types={"id": "int4"})
+
+        assert encoder.types == {"id": "int4", "colour": "text", "created": "timestamptz", "tags": "jsonb"}
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError, match="Unsupported PostgreSQL types"):
+            CopyEncoder(ModelA, types={"id": "point"})
+
+    def test_text(self):
+        chunks = list(CopyEncoder(ModelD).text(MODELS))
+
+        assert chunks == [b"1\tx\t2\ty\t\\N\t\\N\n3\ta\\tb\\\\c\\n\t\\N\t\\N\t4\tz\n"]
+
+    def test_text_chunks(self):
+        chunks = list(CopyEncoder(ModelD, ["id"]).text(MODELS, chunk_size=1))
+
+        assert chunks == [b"1\n", b"3\n"]
+
+    def test_text_types(self):
+        model = CopyModel(id=1, colour=Colour.red, created=datetime(2000, 1, 2, tzinfo=timezone.utc), tags={"a": 1})
+
+        assert list(CopyEncoder(CopyModel).text([model])) == [b'1\tred\t2000-01-02T00:00:00+00:00\t{"a":1}\n']
+
+    def test_binary(self):
+        chunks = list(CopyEncoder(ModelD).binary(MODELS[:1]))
+
+        assert b"".join(chunks) == (
+            HEADER
+            + b"\x00\x06"
+            + b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x01"
+            + b"\x00\x00\x00\x01x"
+            + b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x02"
+            + b"\x00\x00\x00\x01y"
+            + b"\xff\xff\xff\xff"
+            + b"\xff\xff\xff\xff"
+            + TRAILER
+        )
+
+    def test_binary_types(self):
+        model = CopyModel(id=1, colour=Colour.red, created=datetime(2000, 1, 2, tzinfo=timezone.utc))
+        chunks = list(CopyEncoder(CopyModel, types={"id": "int4"}).binary([model]))
+
+        assert chunks == [
+            HEADER
+            + b"\x00\x04"
+            + b"\x00\x00\x00\x04\x00\x00\x00\x01"
+            + b"\x00\x00\x00\x03red"
+            + b"\x00\x00\x00\x08\x00\x00\x00\x14\x1d\xd7\x60\x00"
+            + b"\xff\xff\xff\xff",
+            TRAILER,
+        ]
+
+    def test_binary_empty(self):
+        assert list(CopyEncoder(ModelA).binary([])) == [HEADER + TRAILER]
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (bool, "bool"),
+        (int, "int8"),
+        (int | None, "int8"),
+        (Decimal, "numeric"),
+        (datetime, "timestamptz"),
+        (date, "date"),
+        (uuid.UUID, "uuid"),
+        (Colour, "text"),
+        (list[int], "jsonb"),
+        (ModelA, "jsonb"),
+    ],
+)
+def test_postgres_type(annotation, expected):
+    assert postgres_type(annotation) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Decimal("123.45"), b"\x00\x02\x00\x00\x00\x00\x00\x02\x00\x7b\x11\x94"),
+        (Decimal("-0.001"), b"\x00\x01\xff\xff\x40\x00\x00\x03\x00\x0a"),
+        (Decimal(10000), b"\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01"),
+        (Decimal("0.00"), b"\x00\x00\x00\x00\x00\x00\x00\x02"),
+        (Decimal("NaN"), b"\x00\x00\x00\x00\xc0\x00\x00\x00"),
+    ],
+)
+def test_binary_numeric(value, expected):
+    assert CODECS["numeric"].binary(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("type_", "value", "text", "binary"),
+    [
+        ("bool", True, "t", b"\x01"),
+        ("int2", -1, "-1", b"\xff\xff"),
+        ("float8", float("inf"), "Infinity", b"\x7f\xf0\x00\x00\x00\x00\x00\x00"),
+        ("bytea", b"\x01\xff", "\\x01ff", b"\x01\xff"),
+        ("date", date(1999, 12, 31), "1999-12-31", b"\xff\xff\xff\xff"),
+        ("time", time(0, 0, 1), "00:00:01", b"\x00\x00\x00\x00\x00\x0f\x42\x40"),
+        ("timestamp", datetime(2000, 1, 1, 0, 0, 1), "2000-01-01T00:00:01", b"\x00\x00\x00\x00\x00\x0f\x42\x40"),  # noqa: DTZ001
+        # Aware timestamps are converted to UTC wall time.
+        (
+            "timestamp",
+            datetime(2000, 1, 1, 5, 0, 1, tzinfo=timezone(timedelta(hours=5))),
+            "2000-01-01T00:00:01",
+            b"\x00\x00\x00\x00\x00\x0f\x42\x40",
+        ),
+        (
+            "timestamptz",
+            datetime(2000, 1, 1, 5, 0, 1, tzinfo=timezone(timedelta(hours=5))),
+            "2000-01-01T05:00:01+05:00",
+            b"\x00\x00\x00\x00\x00\x0f\x42\x40",
+        ),
+        # Naive timestamptz values are assumed to be UTC.
+        (
+            "timestamptz",
+            datetime(2000, 1, 1, 0, 0, 1),  # noqa: DTZ001
+            "2000-01-01T00:00:01+00:00",
+            b"\x00\x00\x00\x00\x00\x0f\x42\x40",
+        ),
+        (
+            "interval",
+            timedelta(days=1, microseconds=1),
+            "1 days 0 seconds 1 microseconds",
+            b"\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00",
+        ),
+        ("uuid", uuid.UUID(int=1), "00000000-0000-0000-0000-000000000001", b"\x00" * 15 + b"\x01"),
+        ("jsonb", [1], "[1]", b"\x01[1]"),
+    ],
+)
+def test_codecs(type_, value, text, binary):
+    assert CODECS[type_].text(value) == text
+    assert CODECS[type_].binary(value) == binary
@@ -0,0 +1,70 @@
+import pytest
+
+from pydantic_db import StageTiming, add_profiler, profile, remove_profiler
+from tests.model import ModelA, ModelF
+
+RESULTS = [
+    {"id": 1, "models__id": 1, "models__a": "x"},
+    {"id": 1, "models__id": 2, "models__a": "y"},
+    {"id": 2, "models__id": 3, "models__a": "z"},
+]
+
+
+def stages(timings):
+    return [(t.stage, t.model, t.rows_in, t.models_out) for t in timings]
+
+
+def test_profile_from_results():
+    with profile() as timings:
+        ModelF.from_results(RESULTS)
+
+    assert stages(timings) == [
+        ("parse", ModelF, 3, 3),
+        ("flatten", ModelF, 3, 2),
+        ("validate", ModelF, 2, 2),
+    ]
+    assert all(0 <= t.seconds < 60 for t in timings)  # noqa: PLR2004
+    assert timings[1].fanout == pytest.approx(1.5)
+
+
+def test_profile_iter_results():
+    with profile() as timings:
+        list(ModelF.iter_results(RESULTS))
+
+    # The first parent is complete once the first row of the second parent is parsed.
+    assert stages(timings) == [
+        ("parse", ModelF, 3, 3),
+        ("flatten", ModelF, 2, 1),
+        ("validate", ModelF, 1, 1),
+        ("flatten", ModelF, 1, 1),
+        ("validate", ModelF, 1, 1),
+    ]
+
+
+def test_profile_callback():
+    received = []
+    with profile(received.append) as timings:
+        ModelA.from_results([{"id": 1, "a": "x"}])
+
+    assert received == timings
+    assert all(isinstance(t, StageTiming) for t in received)
+
+
+def test_add_remove_profiler():
+    received = []
+    add_profiler(received.append)
+    try:
+        ModelA.from_rows([(1, "x")], columns=["id", "a"])
+    finally:
+        remove_profiler(received.append)
+    ModelA.from_rows([(1, "x")], columns=["id", "a"])
+
+    assert stages(received) == [
+        ("parse", ModelA, 1, 1),
+        ("flatten", ModelA, 1, 1),
+        ("validate", ModelA, 1, 1),
+    ]
+
+
+def test_fanout_no_models():
+    assert StageTiming("flatten", ModelA, 0, 0, 0.0).fanout == 0.0
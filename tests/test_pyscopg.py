@@ -11,6 +11,12 @@ def cursor(postgres_dsn):
     return db.cursor(cursor_factory=psycopg2.extras.DictCursor)
 
 
+@pytest.fixture
+def tuple_cursor(postgres_dsn):
+    db = psycopg2.connect(postgres_dsn)
+    return db.cursor()
+
+
 class TestModel:
     def test_from_result(self, cursor):
         cursor.execute("select 1 as id, 'x' as a")
@@ -117,3 +123,35 @@ class TestNestedModel:
                 b=ModelB(id=3, b="z"),
             ),
         ]
+
+
+class TestRows:
+    def test_from_cursor(self, tuple_cursor):
+        tuple_cursor.execute("select 1 as id, 'x' as a union all select 2 as id, 'y' as a")
+        models = ModelA.from_cursor(tuple_cursor, batch_size=1)
+
+        assert list(models) == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
+    def test_from_rows(self, tuple_cursor):
+        tuple_cursor.execute("""
+        select
+            1 as id,
+            'x' as d,
+            2 as a__id,
+            'y' as a__a,
+            null as b__id,
+            null as b__b
+        """)
+        models = ModelD.from_rows(tuple_cursor.fetchall(), columns=tuple_cursor.description)
+
+        assert models == [
+            ModelD(
+                id=1,
+                d="x",
+                a=ModelA(id=2, a="y"),
+                b=None,
+            ),
+        ]
@@ -2,7 +2,7 @@ import sqlite3
 
 import pytest
 
-from tests.model import ModelA, ModelB, ModelD, ModelE
+from tests.model import ModelA, ModelB, ModelD, ModelE, ModelF
 
 
 @pytest.fixture
@@ -29,6 +29,15 @@ class TestModel:
             ModelA(id=1, a="x"),
         ]
 
+    def test_iter_results(self, cursor):
+        cursor.execute("select 1 as id, 'x' as a union all select 2 as id, 'y' as a")
+        models = ModelA.iter_results(cursor)
+
+        assert list(models) == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
 
 class TestNestedModel:
     def test_from_result(self, cursor):
@@ -118,3 +127,89 @@ class TestNestedModel:
                 b=ModelB(id=3, b="z"),
             ),
         ]
+
+
+class TestCursor:
+    def test_from_cursor(self, cursor):
+        cursor.execute("select 1 as id, 'x' as a union all select 2 as id, 'y' as a")
+        models = ModelA.from_cursor(cursor, batch_size=1)
+
+        assert list(models) == [
+            ModelA(id=1, a="x"),
+            ModelA(id=2, a="y"),
+        ]
+
+    def test_from_cursor_batches(self):
+        db = sqlite3.connect(":memory:")
+        cursor = db.cursor()
+        cursor.execute("""
+        select 1 as id, 1 as models__id, 'x' as models__a
+        union all select 1 as id, 2 as models__id, 'y' as models__a
+        union all select 2 as id, 3 as models__id, 'z' as models__a
+        """)
+        batches = ModelF.from_cursor(cursor, batch_size=2, batches=True)
+
+        # Parent 1 spans the batch boundary, and is only complete once parent 2 is seen.
+        assert list(batches) == [
+            [ModelF(id=1, models=[ModelA(id=1, a="x"), ModelA(id=2, a="y")])],
+            [ModelF(id=2, models=[ModelA(id=3, a="z")])],
+        ]
+
+    def test_from_cursor_empty(self, cursor):
+        cursor.execute("select 1 as id, 'x' as a where 1 = 0")
+
+        assert list(ModelA.from_cursor(cursor, batches=True)) == []
+
+
+class TestRows:
+    def test_from_rows(self):
+        db = sqlite3.connect(":memory:")
+        cursor = db.cursor()
+        cursor.execute("""
+        select
+            1 as id,
+            'x' as d,
+            2 as a__id,
+            'y' as a__a,
+            null as b__id,
+            null as b__b
+        """)
+        models = ModelD.from_rows(cursor.fetchall(), columns=cursor.description)
+
+        assert models == [
+            ModelD(
+                id=1,
+                d="x",
+                a=ModelA(id=2, a="y"),
+                b=None,
+            ),
+        ]
+
+
+class TestSelectColumns:
+    def test_select_columns(self, cursor):
+        cursor.executescript("""
+        create table a (id integer, a text);
+        create table b (id integer, b text);
+        create table d (id integer, d text, a_id integer, b_id integer);
+        insert into a values (2, 'y');
+        insert into d values (1, 'x', 2, null);
+        """)
+        columns = ModelD.select_columns({"": "d", "a": "a", "b": "b"})
+        cursor.execute(f"select {columns} from d join a on a.id = d.a_id left join b on b.id = d.b_id")
+        models = ModelD.from_results(cursor.fetchall())
+
+        assert models == [ModelD(id=1, d="x", a=ModelA(id=2, a="y"), b=None)]
+
+
+class TestToRows:
+    def test_executemany(self, cursor):
+        cursor.execute("create table d (id integer, d text, a__id integer, a__a text, b__id integer, b__b text)")
+        models = [
+            ModelD(id=1, d="x", a=ModelA(id=2, a="y"), b=None),
+            ModelD(id=3, d="z", a=None, b=ModelB(id=4, b="w")),
+        ]
+        cursor.executemany("insert into d values (?, ?, ?, ?, ?, ?)", ModelD.to_rows(models))
+        cursor.execute("select * from d")
+
+        assert ModelD.from_results(cursor.fetchall()) == models